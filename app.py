@@ -1,11 +1,17 @@
 # app.py (main Flask application file)
-from flask import Flask, request, jsonify, send_from_directory, make_response, render_template
+import time
+_startup_started = time.perf_counter() # For the startup time logged once the app is set up
+from flask import Flask, Response, request, jsonify, send_file, send_from_directory, render_template
 from flask_cors import CORS
 import os
 import json
 import uuid
-import zipfile
-from io import BytesIO
+import hashlib
+import heapq
+import threading
+import math
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from werkzeug.security import generate_password_hash, check_password_hash
 import smtplib
 import random
@@ -19,14 +25,23 @@ load_dotenv()
 
 # Import your NLP processing modules (assuming these exist)
 # Ensure these modules are available in your Render environment
-from text_extractor import extract_text_from_file
-from text_processor import preprocess_text, \
-    extract_skills_from_text, categorize_resume
-from resume_matcher import calculate_match_score_enhanced
+from ingestion import ingest_resume_files, DEFAULT_INGEST_WORKERS
+from task_queue import TaskManager
+from storage import create_store
+from result_cache import ResultSetCache
+from resume_record import ResumeRecord
+from vector_index import VectorIndex
+from skill_index import SkillIndex
+from zip_stream import ArchiveCache, iter_zip
+from resume_matcher import compile_job_profile, score_resumes_for_job, score_matrix, embed_resume_texts, TfidfFallback
+from resume_matcher import RESUME_EMBEDDING_ID, EMBEDDING_CHUNK_WORDS, get_model
+from embedding_cache import vector_to_text, vector_from_text
+from resume_matcher import warm_up as warm_up_matcher
+from text_processor import warm_up as warm_up_text_processor
 
 
 app = Flask(__name__, static_folder='static', template_folder='templates')
-CORS(app)
+CORS(app, expose_headers=['X-Total-Count', 'X-Next-Cursor'])  # Dashboard paging headers
 
 # --- Database (Supabase Integration) ---
 SUPABASE_URL = os.environ.get("SUPABASE_URL")
@@ -47,10 +62,32 @@ except Exception as e:
     supabase = None # Disable Supabase if connection fails
 
 
-# In-memory dbs for temporary session data
-resumes_db = {}  # Stores processed resume data and original file path
-screening_results_db = {}  # Stores results of the *last* screening operation
-job_requirements_db = {} # Stores job requirements temporarily for the current session
+# Session data store. STORAGE_BACKEND=memory (default) keeps it in this process only;
+# STORAGE_BACKEND=sqlite shares it between gunicorn workers through one SQLite file (STORAGE_PATH).
+store = create_store()
+resumes_db = store.namespace('resumes', codec=ResumeRecord)  # Stores processed resume data and original file path
+resume_texts_db = store.namespace('resume_texts')  # Raw extracted text per resume, only read when one resume is viewed
+resume_embeddings_db = store.namespace('resume_embeddings')  # Resume embedding per resume, computed at upload, for the ANN index
+# Screening results per (user_id, job_id); sets expire after RESULT_TTL_SECONDS and the oldest are
+# evicted once more than RESULT_MAX_RESULTS results are held in total
+screening_results_db = ResultSetCache(
+    store.namespace('screening_results'),
+    store.namespace('screening_result_index'),
+    ttl_seconds=int(os.environ.get("RESULT_TTL_SECONDS", 7200)),
+    max_results=int(os.environ.get("RESULT_MAX_RESULTS", 50000))
+)
+job_requirements_db = store.namespace('job_requirements') # Stores job requirements temporarily for the current session
+resume_hash_index = store.namespace('resume_hashes') # SHA-256 of uploaded file bytes -> resume_id, for deduplicating re-uploads
+job_profiles = {} # Compiled job profiles (JD embedding, skill set, experience range) keyed by job_id; per process
+skill_index = SkillIndex() # Skill -> resume ids, to match required skills before loading any resume; per process
+# Approximate nearest-neighbour index over resume embeddings, for /api/find_candidates; per process
+# and filled on demand from the stored resume embeddings (see refresh_resume_index)
+resume_index = VectorIndex(nprobe=int(os.environ.get("ANN_NPROBE", 8)),
+                           train_threshold=int(os.environ.get("ANN_TRAIN_THRESHOLD", 2048)))
+# Embeds resumes that have no stored embedding yet, off the request path (see refresh_resume_index)
+index_builder = ThreadPoolExecutor(max_workers=1, thread_name_prefix='index-builder')
+index_build = None
+index_build_lock = threading.Lock()
 
 # --- Configuration ---
 UPLOAD_FOLDER = 'uploads'
@@ -63,12 +100,253 @@ HF_API_KEY = os.environ.get("HF_API_KEY")
 if not HF_API_KEY:
     print("WARNING: HF_API_KEY environment variable not set. Hugging Face LLM features will be disabled.")
 
+# Worker processes used to extract and analyse uploaded resumes
+INGEST_WORKERS = DEFAULT_INGEST_WORKERS
+
+# Number of resumes embedded per model.encode batch during screening
+SCREENING_BATCH_SIZE = int(os.environ.get("SCREENING_BATCH_SIZE", 32))
+
+# Work is done in chunks of this many files/resumes so background tasks can report progress
+INGEST_CHUNK_SIZE = max(INGEST_WORKERS, 1) * 4
+SCREENING_CHUNK_SIZE = SCREENING_BATCH_SIZE * 4
+
+# With DEFER_UPLOAD_PERSIST=1 the original upload is written to disk on a background
+# thread; text is always extracted straight from the uploaded bytes
+DEFER_UPLOAD_PERSIST = os.environ.get("DEFER_UPLOAD_PERSIST", "0").lower() in ('1', 'true', 'yes')
+upload_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='upload-writer') if DEFER_UPLOAD_PERSIST else None
+
+# Background workers for uploads/screenings requested with ?async=1
+# (task state is mirrored into the store so any worker can answer progress polls; finished
+# tasks are dropped from the store after TASK_RECORD_TTL seconds)
+task_manager = TaskManager(max_workers=int(os.environ.get("TASK_WORKERS", 2)), records=store.namespace('tasks'),
+                           record_ttl_seconds=int(os.environ.get("TASK_RECORD_TTL", 3600)))
+
+# ZIP downloads are streamed as they are built. With ARCHIVE_CACHE_DIR set, finished archives
+# are also kept there (the newest ARCHIVE_CACHE_MAX_FILES) and served again while nothing in
+# them has changed.
+ARCHIVE_CACHE_DIR = os.environ.get("ARCHIVE_CACHE_DIR")
+archive_cache = ArchiveCache(ARCHIVE_CACHE_DIR, max_files=int(os.environ.get("ARCHIVE_CACHE_MAX_FILES", 20))) \
+    if ARCHIVE_CACHE_DIR else None
+
+# Resumes taken from the ANN index for /api/find_candidates before the full rerank
+FIND_CANDIDATES_DEFAULT = int(os.environ.get("FIND_CANDIDATES_DEFAULT", 200))
+
 
 # --- Helper Functions ---
 def generate_id():
     return str(uuid.uuid4())
 
 
+def wants_async():
+    # Long uploads/screenings can run in the background: ?async=1 (or "async": true in a JSON body)
+    flag = request.args.get('async')
+    if flag is None and request.is_json:
+        flag = (request.get_json(silent=True) or {}).get('async')
+    return str(flag).lower() in ('1', 'true', 'yes')
+
+
+def write_upload(filepath, data):
+    try:
+        with open(filepath, 'wb') as f:
+            f.write(data)
+    except Exception as e:
+        print(f"Error saving uploaded file {filepath}: {e}")
+
+
+def persist_upload(unique_filename, data):
+    # Keep the original file for downloads; off the extraction path and optionally deferred
+    filepath = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
+    if upload_writer:
+        upload_writer.submit(write_upload, filepath, data)
+    else:
+        write_upload(filepath, data)
+
+
+def get_result_set(user_id=None, job_id=None):
+    # The screening result set for (user_id, job_id). A job's owner is used when user_id is
+    # missing; with no job_id, the user's most recent set. Never another user's set: with
+    # neither id there is nothing to return.
+    if job_id:
+        if not user_id:
+            job_req = job_requirements_db.get(job_id)
+            user_id = job_req['user_id'] if job_req else None
+        return screening_results_db.get(user_id, job_id) if user_id else None
+    if not user_id:
+        return None
+    return screening_results_db.latest(user_id)
+
+
+class InvalidParameter(ValueError):
+    # A malformed request parameter; answered with a 400 by the handler below
+    pass
+
+
+@app.errorhandler(InvalidParameter)
+def invalid_parameter(e):
+    return jsonify({"message": str(e)}), 400
+
+
+def number_param(params, name, kind=int, minimum=0, maximum=None):
+    # An optional number from the query string or a JSON body (None if absent). Raises
+    # InvalidParameter for anything that is not a finite number of `kind` within bounds.
+    value = params.get(name)
+    if value is None or value == '':
+        return None
+    try:
+        if isinstance(value, bool) or (kind is int and isinstance(value, float) and not value.is_integer()):
+            raise ValueError(value)
+        number = kind(value)
+        if not math.isfinite(number):
+            raise ValueError(value)
+    except (TypeError, ValueError):
+        raise InvalidParameter(f"{name} must be {'a whole number' if kind is int else 'a number'}")
+    if number < minimum or (maximum is not None and number > maximum):
+        bounds = f"between {minimum} and {maximum}" if maximum is not None else f"at least {minimum}"
+        raise InvalidParameter(f"{name} must be {bounds}")
+    return number
+
+
+def paginate(items, cursor=None, limit=None):
+    # Returns (page, next_cursor). The cursor (as parsed by number_param) is a position;
+    # next_cursor is None on the last page. Without a limit everything from the cursor on is returned.
+    start = cursor or 0
+    if not limit:
+        return items[start:], None
+    end = start + limit
+    return items[start:end], (str(end) if end < len(items) else None)
+
+
+def get_job_profile(job_id, job_req):
+    # The compiled profile for a saved job; compiled on first use in this process
+    job_profile = job_profiles.get(job_id)
+    if job_profile is None:
+        job_profile = compile_job_profile(job_req['job_description'], job_req['skills'], job_req['experience_required'])
+        job_profiles[job_id] = job_profile
+    return job_profile
+
+
+def zip_response(entries, download_name):
+    # Streams a ZIP of (path, arcname) entries, or serves it from archive_cache when an
+    # identical archive was built before
+    headers = {'Content-Disposition': f'attachment; filename={download_name}'}
+    chunks = iter_zip(entries)
+    if archive_cache:
+        key = archive_cache.key(entries)
+        cached_path = archive_cache.get(key)
+        if cached_path:
+            return send_file(cached_path, mimetype='application/zip', as_attachment=True, download_name=download_name)
+        chunks = archive_cache.iter_and_store(key, chunks)
+    return Response(chunks, mimetype='application/zip', headers=headers)
+
+
+def store_resume_embeddings(resume_ids, embeddings):
+    for resume_id, embedding in zip(resume_ids, embeddings):
+        resume_embeddings_db[resume_id] = {'model': RESUME_EMBEDDING_ID, 'vector': vector_to_text(embedding)}
+
+
+def screening_embeddings(resume_ids, resume_records):
+    # Resume embeddings for screening, read from resume_embeddings_db so any worker screens with
+    # a dot product; resumes without a current one are embedded now and stored for next time.
+    # None (the scorer then encodes or falls back itself) with chunking on, whose scores pool
+    # per-chunk similarities, or when the model is unavailable.
+    if EMBEDDING_CHUNK_WORDS or get_model() is None:
+        return None
+    stored = resume_embeddings_db.get_many(resume_ids)
+    embeddings = {resume_id: vector_from_text(entry['vector']) for resume_id, entry in stored.items()
+                  if entry['model'] == RESUME_EMBEDDING_ID}
+    missing_ids = [resume_id for resume_id in resume_ids if resume_id not in embeddings]
+    if missing_ids:
+        try:
+            computed = embed_resume_texts([resume_records[resume_id].processed_text for resume_id in missing_ids],
+                                          batch_size=SCREENING_BATCH_SIZE)
+        except Exception as e:
+            print(f"Could not embed resumes for screening: {e}")
+            return None
+        store_resume_embeddings(missing_ids, computed)
+        embeddings.update(zip(missing_ids, computed))
+    return np.vstack([embeddings[resume_id] for resume_id in resume_ids])
+
+
+def sync_resume_index():
+    # Makes this process's resume_index hold exactly the stored resumes, compared by id: drops
+    # resumes no longer in the store (e.g. cleared through another worker) and adds those missing
+    # (uploaded by another worker, or before a restart) from their stored embeddings. Never runs
+    # the model. Returns the ids of resumes without a current stored embedding.
+    stored_ids = list(resumes_db)
+    stored_id_set = set(stored_ids)
+    stale_ids = [resume_id for resume_id in resume_index.ids() if resume_id not in stored_id_set]
+    if stale_ids:
+        resume_index.remove(stale_ids)
+    missing_ids = [resume_id for resume_id in stored_ids if resume_id not in resume_index]
+    unembedded_ids = []
+    for chunk_ids in chunked(missing_ids, SCREENING_CHUNK_SIZE):
+        stored = resume_embeddings_db.get_many(chunk_ids)
+        indexed_ids = []
+        for resume_id in chunk_ids:
+            entry = stored.get(resume_id)
+            if entry and entry['model'] == RESUME_EMBEDDING_ID:
+                indexed_ids.append(resume_id)
+            else:
+                unembedded_ids.append(resume_id)
+        if indexed_ids:
+            resume_index.add(indexed_ids, np.vstack([vector_from_text(stored[resume_id]['vector'])
+                                                     for resume_id in indexed_ids]))
+    return unembedded_ids
+
+
+def embed_missing_resumes(resume_ids):
+    # Runs on index_builder: embeds, stores and indexes resumes that have no stored embedding
+    try:
+        for chunk_ids in chunked(resume_ids, SCREENING_CHUNK_SIZE):
+            records = resumes_db.get_many(chunk_ids)
+            chunk_ids = [resume_id for resume_id in chunk_ids if resume_id in records]
+            embeddings = embed_resume_texts([records[resume_id].processed_text for resume_id in chunk_ids],
+                                            batch_size=SCREENING_BATCH_SIZE)
+            store_resume_embeddings(chunk_ids, embeddings)
+            resume_index.add(chunk_ids, embeddings)
+    except Exception as e:
+        print(f"Could not embed resumes for the index: {e}")
+
+
+def refresh_resume_index():
+    # Brings resume_index up to date from the stored embeddings and queues embedding the rest
+    # in the background (one build at a time). Returns how many resumes are not indexed yet.
+    global index_build
+    unembedded_ids = sync_resume_index()
+    with index_build_lock:
+        if unembedded_ids and (index_build is None or index_build.done()):
+            index_build = index_builder.submit(embed_missing_resumes, unembedded_ids)
+    return len(unembedded_ids)
+
+
+def page_from_order(results, order, cursor=None, limit=None, keep=None):
+    # Walks `order` (positions into results) from the cursor and returns (page, next_cursor),
+    # skipping results for which keep(result) is false; only the page itself is materialised
+    position = cursor or 0
+    page = []
+    while position < len(order) and (not limit or len(page) < limit):
+        result = results[order[position]]
+        position += 1
+        if keep is None or keep(result):
+            page.append(result)
+    return page, (str(position) if position < len(order) else None)
+
+
+def rank_results(results, top_k=None, min_score=None):
+    # Best results first. With top_k a heap keeps only k candidates (O(n log k)) instead
+    # of sorting the whole list; ties keep their screening order
+    if min_score is not None:
+        results = [result for result in results if result['match_score'] >= min_score]
+    if top_k:
+        return heapq.nlargest(top_k, results, key=lambda result: result['match_score'])
+    return sorted(results, key=lambda result: result['match_score'], reverse=True)
+
+
+def chunked(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
 def generate_otp():
     return str(random.randint(100000, 999999))
 
@@ -396,6 +674,12 @@ def save_job_requirements():
     if not user_id or not job_description or not skills:
         return jsonify({"message": "User ID, job description, and skills are required"}), 400
 
+    # Parse and embed the job once here so screening only reads precomputed fields
+    try:
+        job_profile = compile_job_profile(job_description, skills, experience_required)
+    except ValueError:
+        return jsonify({"message": "Experience required must look like '3-5', '5+' or 'Any'"}), 400
+
     # Generate a unique ID for this set of job requirements
     job_id = generate_id()
 
@@ -407,44 +691,220 @@ def save_job_requirements():
         'skills': skills,
         'experience_required': experience_required # Store new field
     }
+    job_profiles[job_id] = job_profile
     print(f"Job requirements saved in-memory with ID: {job_id}")
     return jsonify({"message": "Job requirements saved temporarily", "job_id": job_id}), 201
 
 
+def ingest_uploaded_files(uploaded_files, progress=None):
+    # Runs extraction/NLP on the uploaded bytes, stores the resumes and persists the originals.
+    # uploaded_files is a list of (original_filename, unique_filename, data).
+    # A file whose bytes were already processed reuses that resume instead of being re-run.
+    uploaded_resume_ids = []
+    failed_files = []
+    deduplicated_files = []
+    if progress:
+        progress.set_total(len(uploaded_files))
+
+    for chunk in chunked(uploaded_files, INGEST_CHUNK_SIZE):
+        content_hashes = [hashlib.sha256(data).hexdigest() for _, _, data in chunk]
+
+        # Only the first copy of content not seen before goes through extraction and NLP
+        known_resume_ids = resume_hash_index.get_many(set(content_hashes))
+        known_resumes = resumes_db.get_many(set(known_resume_ids.values()))
+        to_process = {}  # content_hash -> position in chunk
+        for position, content_hash in enumerate(content_hashes):
+            if content_hash not in to_process and known_resume_ids.get(content_hash) not in known_resumes:
+                to_process[content_hash] = position
+
+        # Extraction and NLP run in parallel worker processes; results come back in upload order
+        ingested = ingest_resume_files([chunk[position][2] for position in to_process.values()],
+                                       filenames=[chunk[position][0] for position in to_process.values()],
+                                       max_workers=INGEST_WORKERS)
+        ingested_by_hash = dict(zip(to_process, ingested))
+
+        chunk_resume_ids = []
+        new_resume_ids = []
+        chunk_results = []
+        for (original_filename, unique_filename, data), content_hash in zip(chunk, content_hashes):
+            existing_resume_id = known_resume_ids.get(content_hash)
+            if existing_resume_id in known_resumes:
+                deduplicated_files.append({'filename': original_filename, 'resume_id': existing_resume_id,
+                                           'duplicate_of': known_resumes[existing_resume_id].filename})
+                chunk_resume_ids.append(existing_resume_id)
+                chunk_results.append({'filename': original_filename, 'resume_id': existing_resume_id,
+                                      'deduplicated': True})
+                continue
+
+            resume_fields, error = ingested_by_hash[content_hash]
+            if error:
+                failed_files.append({'filename': original_filename, 'error': error})
+                chunk_results.append({'filename': original_filename, 'error': error})
+                continue
+
+            persist_upload(unique_filename, data)
+
+            resume_id = generate_id()
+            resume_data = ResumeRecord(
+                filename=original_filename,
+                filepath=unique_filename,
+                content_hash=content_hash,
+                processed_text=resume_fields['processed_text'],
+                extracted_skills=resume_fields['extracted_skills'],
+                categorized_field=resume_fields['categorized_field'], # Store new field
+                category_scores=resume_fields['category_scores'],
+                page_offsets=resume_fields['page_offsets'],
+                experience_profile=resume_fields['experience_profile']
+            )
+            resume_texts_db[resume_id] = resume_fields['raw_text']
+            resumes_db[resume_id] = resume_data
+            skill_index.add(resume_id, resume_data.extracted_skills)
+            resume_hash_index[content_hash] = resume_id
+            # Later duplicates in this batch resolve to the resume just created
+            known_resume_ids[content_hash] = resume_id
+            known_resumes[resume_id] = resume_data
+            chunk_resume_ids.append(resume_id)
+            new_resume_ids.append(resume_id)
+            chunk_results.append({'filename': original_filename, 'resume_id': resume_id})
+
+        # Embed the new resumes now so screening only needs a dot product. If this fails
+        # the embeddings are computed lazily on the first screen instead.
+        try:
+            new_embeddings = embed_resume_texts([known_resumes[resume_id].processed_text for resume_id in new_resume_ids],
+                                                batch_size=SCREENING_BATCH_SIZE)
+            store_resume_embeddings(new_resume_ids, new_embeddings)
+            resume_index.add(new_resume_ids, new_embeddings)
+        except Exception as e:
+            print(f"Could not precompute resume embeddings: {e}")
+
+        uploaded_resume_ids.extend(chunk_resume_ids)
+        if progress:
+            progress.advance(len(chunk), chunk_results)
+
+    # A duplicate upload is reported under "deduplicated" but its resume id is listed once
+    return {"resume_ids": list(dict.fromkeys(uploaded_resume_ids)), "failed": failed_files,
+            "deduplicated": deduplicated_files}
+
+
 @app.route('/api/upload_resumes', methods=['POST'])
 def upload_resumes():
     if 'files' not in request.files:
         return jsonify({"message": "No file part"}), 400
 
     files = request.files.getlist('files')
-    uploaded_resume_ids = []
 
+    # Read each upload into memory; text is extracted from these bytes, not from a saved copy
+    uploaded_files = []
     for file in files:
         if file.filename == '':
             continue
 
         original_filename = file.filename
         unique_filename = f"{uuid.uuid4()}_{original_filename}"
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-        file.save(filepath)
-
-        raw_text = extract_text_from_file(filepath)
-        processed_text = preprocess_text(raw_text)
-        extracted_skills = extract_skills_from_text(processed_text)
-        categorized_field = categorize_resume(processed_text) # New categorization
-
-        resume_id = generate_id()
-        resumes_db[resume_id] = {
-            'filename': original_filename,
-            'filepath': unique_filename,
-            'raw_text': raw_text,
-            'processed_text': processed_text,
-            'extracted_skills': extracted_skills,
-            'categorized_field': categorized_field # Store new field
-        }
-        uploaded_resume_ids.append(resume_id)
+        uploaded_files.append((original_filename, unique_filename, file.read()))
+
+    if wants_async():
+        task_id = task_manager.submit('upload_resumes', ingest_uploaded_files, uploaded_files)
+        return jsonify({"message": "Resume upload accepted", "task_id": task_id}), 202
 
-    return jsonify({"message": "Resumes uploaded and processed", "resume_ids": uploaded_resume_ids}), 200
+    uploaded = ingest_uploaded_files(uploaded_files)
+    return jsonify({"message": "Resumes uploaded and processed", "resume_ids": uploaded['resume_ids'],
+                    "failed": uploaded['failed'], "deduplicated": uploaded['deduplicated']}), 200
+
+
+def run_screening(job_id, job_req, resume_ids, user_id, progress=None, min_skill_coverage=None):
+    # Scores the given resumes against a saved job and stores them as this user's result set.
+    # With min_skill_coverage (0-1), resumes matching a smaller share of the required skills
+    # are left out before their records are loaded or embedded.
+    job_profile = get_job_profile(job_id, job_req)
+    required_department = job_req['department']
+    required_department_lower = required_department.lower() if required_department else None
+
+    results = []
+    # A resume listed more than once is screened once
+    resume_ids = list(dict.fromkeys(resume_ids))
+
+    # Resumes uploaded through another worker (or before a restart) join the skill index first
+    unindexed_ids = [resume_id for resume_id in resume_ids if resume_id not in skill_index]
+    for resume_id, resume_data in resumes_db.get_many(unindexed_ids).items():
+        skill_index.add(resume_id, resume_data.extracted_skills)
+    skill_matches = skill_index.matches(job_profile['required_skills'], resume_ids)
+
+    if min_skill_coverage and job_profile['required_skills']:
+        required_matches = min_skill_coverage * len(job_profile['required_skills'])
+        resume_ids = [resume_id for resume_id in resume_ids
+                      if len(skill_matches.get(resume_id, ())) >= required_matches]
+
+    # Fetch all resume records in one go rather than one store lookup per field access
+    resume_records = resumes_db.get_many(resume_ids)
+    screened_ids = []
+    for resume_id in resume_ids:
+        if resume_id not in resume_records:
+            # --- DEBUGGING STEP 2 ---
+            #print(f"WARNING: Resume ID {resume_id} not found in resumes_db. Skipping.")
+            # -------------------------
+            continue
+        screened_ids.append(resume_id)
+    if progress:
+        progress.set_total(len(screened_ids))
+    # Only fitted if embeddings are unavailable; then once, over every screened resume
+    tfidf = TfidfFallback([job_profile['job_description']],
+                          [resume_records[resume_id].processed_text for resume_id in screened_ids])
+
+    for chunk_ids in chunked(screened_ids, SCREENING_CHUNK_SIZE):
+        # Score the chunk in one batch; the job description is encoded once in its profile
+        match_scores = score_resumes_for_job(
+            job_profile,
+            [(resume_records[resume_id].processed_text, resume_records[resume_id].extracted_skills)
+             for resume_id in chunk_ids],
+            batch_size=SCREENING_BATCH_SIZE,
+            skill_matches=[skill_matches.get(resume_id, []) for resume_id in chunk_ids],
+            experience_profiles=[resume_records[resume_id].experience_profile for resume_id in chunk_ids],
+            tfidf=tfidf,
+            resume_embeddings=screening_embeddings(chunk_ids, resume_records)
+        )
+
+        chunk_results = []
+        for resume_id, (match_score, matched_skills) in zip(chunk_ids, match_scores):
+            resume_data = resume_records[resume_id]
+            resume_processed_text = resume_data.processed_text
+            resume_categorized_field = resume_data.categorized_field # New field
+            # --- DEBUGGING STEP 3 ---
+            #print(f"Processing Resume: {resume_data.filename}")
+            # -------------------------
+
+            department_match_factor = 1.0
+            # Check if required_department is present in the resume's processed text
+            if required_department_lower and required_department_lower in resume_processed_text.lower():
+                department_match_factor = 1.05 # Apply a small boost for department match
+
+            final_score = int(match_score * department_match_factor)
+            final_score = min(final_score, 100) # Cap score at 100
+            # --- DEBUGGING STEP 4 ---
+            #print(f"Calculated Score for {resume_data.filename}: {final_score}")
+            # -------------------------
+            result = {
+                'job_id': job_id,
+                'resume_id': resume_id,
+                'filename': resume_data.filename,
+                'filepath': resume_data.filepath,
+                'match_score': final_score,
+                'matched_skills': matched_skills,
+                'department': required_department,  # Include department in results for display
+                'categorized_field': resume_categorized_field,  # Include categorized field
+                'category_scores': resume_data.category_scores
+            }
+            chunk_results.append(result)
+            # --- DEBUGGING STEP 5 ---
+            #print(f"--- Final Screening Results to be Sent: {results} ---")
+            # -------------------------
+        results.extend(chunk_results)
+        if progress:
+            progress.advance(len(chunk_ids), chunk_results)
+
+    # Replaces only this user's previous results for the job; other users are unaffected
+    screening_results_db.put(user_id, job_id, results)
+    return results
 
 
 @app.route('/api/screen_resumes', methods=['POST'])
@@ -452,6 +912,7 @@ def screen_resumes():
     data = request.json
     job_id = data.get('job_id')
     resume_ids = data.get('resume_ids')
+    user_id = data.get('user_id')
 
     # --- DEBUGGING STEP 1 ---
     #print(f"--- Screening Resumes for Job ID: {job_id} ---")
@@ -465,76 +926,231 @@ def screen_resumes():
     if not job_req:
         return jsonify({"message": "Job requirements not found or session expired. Please re-enter job details."}), 404
 
-    job_description_text = job_req['job_description']
-    required_skills = job_req['skills']
-    required_department = job_req['department']
-    experience_required = job_req['experience_required'] # New field
+    # Results are stored per (user, job); default to the user who saved the job
+    user_id = user_id or job_req['user_id']
+    # Optional prefilter: only score resumes with at least this share (0-1) of the required skills
+    min_skill_coverage = number_param(data, 'min_skill_coverage', float, maximum=1)
+    top_k = number_param(data, 'top_k')
+    min_score = number_param(data, 'min_score', float)
+    cursor = number_param(data, 'cursor')
+    limit = number_param(data, 'limit')
+
+    if wants_async():
+        # Partial results are published through /api/tasks/<task_id>; the final result
+        # only carries a count so the full list is not stored twice
+        task_id = task_manager.submit(
+            'screen_resumes',
+            lambda progress: {"screened": len(run_screening(job_id, job_req, resume_ids, user_id, progress,
+                                                            min_skill_coverage))}
+        )
+        return jsonify({"message": "Screening accepted", "task_id": task_id}), 202
 
-    results = []
-    screening_results_db.clear() # Clear previous screening results
+    results = run_screening(job_id, job_req, resume_ids, user_id, min_skill_coverage=min_skill_coverage)
 
-    for resume_id in resume_ids:
-        if resume_id not in resumes_db:
-            # --- DEBUGGING STEP 2 ---
-            #print(f"WARNING: Resume ID {resume_id} not found in resumes_db. Skipping.")
-            # -------------------------
-            continue
+    # Optional ranking: "top_k" best results and/or those scoring at least "min_score",
+    # best first. The stored result set always keeps every screened resume.
+    if top_k or min_score is not None:
+        results = rank_results(results, top_k, min_score)
+
+    # Optional paging: "limit" results per response, continue with the returned "next_cursor"
+    page, next_cursor = paginate(results, cursor, limit)
+    return jsonify({"message": "Screening complete", "results": page, "total": len(results),
+                    "next_cursor": next_cursor}), 200
+
+
+@app.route('/api/find_candidates', methods=['POST'])
+def find_candidates():
+    # Screens a job against the whole resume pool without the client listing resume_ids: the
+    # ANN index picks the "candidates" (default FIND_CANDIDATES_DEFAULT) semantically closest
+    # resumes, and only those get the full match score. Accepts the same top_k/min_score/
+    # limit/cursor/min_skill_coverage options as /api/screen_resumes; results are always best first.
+    data = request.json
+    job_id = data.get('job_id')
+    job_req = job_requirements_db.get(job_id)
+    if not job_req:
+        return jsonify({"message": "Job requirements not found or session expired. Please re-enter job details."}), 404
+    user_id = data.get('user_id') or job_req['user_id']
+    candidate_count = number_param(data, 'candidates', minimum=1) or FIND_CANDIDATES_DEFAULT
+    nprobe = number_param(data, 'nprobe', minimum=1)
+    min_skill_coverage = number_param(data, 'min_skill_coverage', float, maximum=1)
+    top_k = number_param(data, 'top_k')
+    min_score = number_param(data, 'min_score', float)
+    cursor = number_param(data, 'cursor')
+    limit = number_param(data, 'limit')
+
+    job_profile = get_job_profile(job_id, job_req)
+    if job_profile['embedding'] is None:
+        return jsonify({"message": "Semantic search is unavailable: the embedding model is not loaded."}), 503
+
+    # Resumes still being embedded in the background are left out of this search; the
+    # response reports how many ("pending_embeddings")
+    try:
+        pending_embeddings = refresh_resume_index()
+    except Exception as e:
+        print(f"Could not index resume embeddings: {e}")
+        return jsonify({"message": "Semantic search is unavailable: resumes could not be indexed."}), 503
 
-        resume_data = resumes_db[resume_id]
-        resume_processed_text = resume_data['processed_text']
-        resume_extracted_skills = resume_data['extracted_skills']
-        resume_categorized_field = resume_data['categorized_field'] # New field
-        # --- DEBUGGING STEP 3 ---
-        #print(f"Processing Resume: {resume_data.get('filename')}")
-        # -------------------------
-
-        # Call the enhanced match score function
-        match_score, matched_skills = calculate_match_score_enhanced(
-            job_description_text,
-            required_skills,
-            experience_required, # Pass new field
-            resume_processed_text,
-            resume_extracted_skills,
-            HF_API_KEY # Pass Hugging Face API Key
+    candidates = resume_index.search(job_profile['embedding'], k=candidate_count, nprobe=nprobe)
+    candidate_ids = [resume_id for resume_id, _ in candidates]
+
+    if wants_async():
+        task_id = task_manager.submit(
+            'find_candidates',
+            lambda progress: {"screened": len(run_screening(job_id, job_req, candidate_ids, user_id, progress,
+                                                            min_skill_coverage))}
         )
+        return jsonify({"message": "Screening accepted", "task_id": task_id, "candidates": len(candidate_ids),
+                        "pending_embeddings": pending_embeddings}), 202
+
+    results = rank_results(run_screening(job_id, job_req, candidate_ids, user_id,
+                                         min_skill_coverage=min_skill_coverage),
+                           top_k, min_score)
+    page, next_cursor = paginate(results, cursor, limit)
+    return jsonify({"message": "Screening complete", "results": page, "total": len(results),
+                    "candidates": len(candidate_ids), "pending_embeddings": pending_embeddings,
+                    "next_cursor": next_cursor}), 200
+
+
+def run_matrix_screening(job_ids, job_reqs, resume_ids, user_id=None, top_k=10, progress=None):
+    # Scores every resume against every job in one score_matrix() pass per chunk of resumes.
+    # Each job's full results are stored as its result set (as run_screening does); the
+    # returned summary holds the top_k resumes per job and the best job per resume.
+    job_profiles_list = [get_job_profile(job_id, job_reqs[job_id]) for job_id in job_ids]
+
+    resume_records = resumes_db.get_many(resume_ids)
+    screened_ids = [resume_id for resume_id in dict.fromkeys(resume_ids) if resume_id in resume_records]
+    for resume_id in screened_ids:
+        if resume_id not in skill_index:
+            skill_index.add(resume_id, resume_records[resume_id].extracted_skills)
+    if progress:
+        progress.set_total(len(screened_ids))
+    tfidf = TfidfFallback([job_profile['job_description'] for job_profile in job_profiles_list],
+                          [resume_records[resume_id].processed_text for resume_id in screened_ids])
+
+    score_chunks = []
+    for chunk_ids in chunked(screened_ids, SCREENING_CHUNK_SIZE):
+        score_chunks.append(score_matrix(
+            job_profiles_list,
+            [(resume_records[resume_id].processed_text, resume_records[resume_id].extracted_skills)
+             for resume_id in chunk_ids],
+            batch_size=SCREENING_BATCH_SIZE,
+            experience_profiles=[resume_records[resume_id].experience_profile for resume_id in chunk_ids],
+            tfidf=tfidf,
+            resume_embeddings=screening_embeddings(chunk_ids, resume_records)
+        ))
+        if progress:
+            progress.advance(len(chunk_ids))
+    scores = np.hstack(score_chunks) if score_chunks else np.zeros((len(job_ids), 0))
+
+    # Department boost per job, then the same rounding and cap as run_screening
+    processed_texts_lower = [resume_records[resume_id].processed_text.lower() for resume_id in screened_ids]
+    for row, job_id in enumerate(job_ids):
+        required_department = job_reqs[job_id]['department']
+        if required_department:
+            department_lower = required_department.lower()
+            scores[row] *= [1.05 if department_lower in text else 1.0 for text in processed_texts_lower]
+    final_scores = np.minimum(np.floor(scores), 100).astype(int)
+
+    jobs_summary = []
+    for row, job_id in enumerate(job_ids):
+        job_req = job_reqs[job_id]
+        skill_matches = skill_index.matches(job_profiles_list[row]['required_skills'], screened_ids)
+        results = []
+        for column, resume_id in enumerate(screened_ids):
+            resume_data = resume_records[resume_id]
+            results.append({
+                'job_id': job_id,
+                'resume_id': resume_id,
+                'filename': resume_data.filename,
+                'filepath': resume_data.filepath,
+                'match_score': int(final_scores[row, column]),
+                'matched_skills': skill_matches.get(resume_id, []),
+                'department': job_req['department'],
+                'categorized_field': resume_data.categorized_field,
+                'category_scores': resume_data.category_scores
+            })
+        screening_results_db.put(user_id or job_req['user_id'], job_id, results)
+        jobs_summary.append({'job_id': job_id, 'top_resumes': rank_results(results, top_k)})
+
+    # Ties go to the job listed first
+    best_rows = np.argmax(final_scores, axis=0) if screened_ids else []
+    resumes_summary = [{
+        'resume_id': resume_id,
+        'filename': resume_records[resume_id].filename,
+        'best_job_id': job_ids[best_rows[column]],
+        'match_score': int(final_scores[best_rows[column], column]),
+        'scores': {job_id: int(final_scores[row, column]) for row, job_id in enumerate(job_ids)}
+    } for column, resume_id in enumerate(screened_ids)]
+
+    return {"jobs": jobs_summary, "resumes": resumes_summary}
+
+
+@app.route('/api/screen_matrix', methods=['POST'])
+def screen_matrix():
+    # Screens many resumes against many saved jobs at once: {"job_ids": [...], "resume_ids": [...],
+    # "top_k": 10, "user_id": optional}. Returns the top_k resumes per job and, per resume, its
+    # best job and its score for every job. Each job's results are also stored for the dashboard.
+    data = request.json
+    job_ids = list(dict.fromkeys(data.get('job_ids') or []))
+    resume_ids = data.get('resume_ids') or []
+    user_id = data.get('user_id')
+    top_k = number_param(data, 'top_k') or 10
+
+    job_reqs = job_requirements_db.get_many(job_ids)
+    missing_job_ids = [job_id for job_id in job_ids if job_id not in job_reqs]
+    job_ids = [job_id for job_id in job_ids if job_id in job_reqs]
+    if not job_ids:
+        return jsonify({"message": "Job requirements not found or session expired. Please re-enter job details.",
+                        "missing_job_ids": missing_job_ids}), 404
+
+    if wants_async():
+        task_id = task_manager.submit(
+            'screen_matrix',
+            lambda progress: run_matrix_screening(job_ids, job_reqs, resume_ids, user_id, top_k, progress)
+        )
+        return jsonify({"message": "Screening accepted", "task_id": task_id, "missing_job_ids": missing_job_ids}), 202
+
+    summary = run_matrix_screening(job_ids, job_reqs, resume_ids, user_id, top_k)
+    return jsonify({"message": "Screening complete", "missing_job_ids": missing_job_ids, **summary}), 200
 
-        department_match_factor = 1.0
-        # Check if required_department is present in the resume's processed text
-        if required_department and required_department.lower() in resume_processed_text.lower():
-            department_match_factor = 1.05 # Apply a small boost for department match
-
-        final_score = int(match_score * department_match_factor)
-        final_score = min(final_score, 100) # Cap score at 100
-        # --- DEBUGGING STEP 4 ---
-        #print(f"Calculated Score for {resume_data.get('filename')}: {final_score}")
-        # -------------------------
-        screening_results_db[resume_id] = {
-            'job_id': job_id,
-            'resume_id': resume_id,
-            'filename': resume_data['filename'],
-            'filepath': resume_data['filepath'],
-            'raw_text': resume_data['raw_text'],  # Include raw text for view
-            'match_score': final_score,
-            'matched_skills': matched_skills,
-            'department': required_department,  # Include department in results for display
-            'categorized_field': resume_categorized_field  # Include categorized field
-        }
-        results.append(screening_results_db[resume_id])
-        # --- DEBUGGING STEP 5 ---
-        #print(f"--- Final Screening Results to be Sent: {results} ---")
-        # -------------------------
-    return jsonify({"message": "Screening complete", "results": results}), 200
+
+@app.route('/api/tasks/<task_id>', methods=['GET'])
+def get_task_status(task_id):
+    # Poll with ?since=<next_since from the previous poll> to only receive new partial results
+    since = number_param(request.args, 'since') or 0
+    task = task_manager.get(task_id, since=since)
+    if task is None:
+        return jsonify({"message": "Task not found"}), 404
+    return jsonify(task), 200
 
 
 @app.route('/api/dashboard_data', methods=['GET'])
 def get_dashboard_data():
-    results = list(screening_results_db.values())
+    # Reads the stored result set for ?user_id=&job_id= (the user's latest set without a job_id);
+    # nothing is re-screened.
+    # Pages are read from the set's presorted orders, so nothing is re-sorted per request.
+    # With ?limit=N only N rows are returned; the X-Next-Cursor header (absent on the last
+    # page) is passed back as ?cursor= for the next page. X-Total-Count is the number of rows
+    # matching the request (after any ?category= filter) across all pages.
+    if not request.args.get('user_id') and not request.args.get('job_id'):
+        return jsonify({"message": "user_id or job_id is required"}), 400
+    cursor = number_param(request.args, 'cursor')
+    limit = number_param(request.args, 'limit')
+    result_set = get_result_set(request.args.get('user_id'), request.args.get('job_id'))
+    if not result_set:
+        return jsonify([]), 200
 
     sort_by = request.args.get('sort_by', 'score')
-    if sort_by == 'score':
-        results.sort(key=lambda x: x['match_score'], reverse=True)
-    elif sort_by == 'name':
-        results.sort(key=lambda x: x['filename'])
+    if sort_by in ('score', 'name'):
+        order = ResultSetCache.order(result_set, sort_by)
+    else:
+        order = range(len(result_set['results']))
+
+    # Optional category filter: keep resumes with at least one keyword hit in that category
+    category = request.args.get('category')
+    keep = (lambda res: res.get('category_scores', {}).get(category)) if category else None
+
+    results, next_cursor = page_from_order(result_set['results'], order, cursor, limit, keep)
 
     formatted_results = []
     for res in results:
@@ -545,47 +1161,51 @@ def get_dashboard_data():
             'matchedSkills': res['matched_skills'],
             'department': res.get('department', 'N/A'),
             'category': res.get('categorized_field', 'Uncategorized'),
+            'categoryScores': res.get('category_scores', {}),
             'shortlisted': False
         })
 
-    return jsonify(formatted_results), 200
+    response = jsonify(formatted_results)
+    if keep is None:
+        total_count = len(result_set['results'])
+    else:
+        total_count = sum(1 for res in result_set['results'] if keep(res))
+    response.headers['X-Total-Count'] = str(total_count)
+    if next_cursor is not None:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response, 200
 
 
 @app.route('/api/resume/<resume_id>', methods=['GET'])
 def get_resume_raw_text(resume_id):
-    if resume_id in resumes_db:
+    # Screening results no longer carry the raw text; it is loaded here, one resume at a time
+    raw_text = resume_texts_db.get(resume_id)
+    if raw_text is not None:
         # IMPORTANT: The frontend expects a 'content' field, not 'raw_text'.
-        return jsonify({"content": resumes_db[resume_id]['raw_text']}), 200
+        return jsonify({"content": raw_text}), 200
     return jsonify({"message": "Resume not found"}), 404
 
 @app.route('/api/download_all_resumes/<job_id>', methods=['GET'])
 def download_all_resumes_for_job(job_id):
     # This logic assumes you want to download all resumes associated with a screening,
     # not just the filtered ones.
-    resumes_to_download = []
-    for resume_id, result in screening_results_db.items():
-        if result['job_id'] == job_id:
-            resumes_to_download.append(result)
+    result_set = get_result_set(request.args.get('user_id'), job_id)
+    resumes_to_download = result_set['results'] if result_set else []
 
     if not resumes_to_download:
         return jsonify({"message": "No resumes found for this job ID."}), 404
 
-    memory_file = BytesIO()
-    with zipfile.ZipFile(memory_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for resume_data in resumes_to_download:
-            unique_filename_on_server = resume_data.get('filepath')
-            original_filename = resume_data.get('filename')
+    entries = []
+    for resume_data in resumes_to_download:
+        unique_filename_on_server = resume_data.get('filepath')
+        original_filename = resume_data.get('filename')
 
-            if unique_filename_on_server and original_filename:
-                full_filepath = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename_on_server)
-                if os.path.exists(full_filepath):
-                    zf.write(full_filepath, arcname=original_filename)
+        if unique_filename_on_server and original_filename:
+            full_filepath = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename_on_server)
+            if os.path.exists(full_filepath):
+                entries.append((full_filepath, original_filename))
 
-    memory_file.seek(0)
-    response = make_response(memory_file.getvalue())
-    response.headers['Content-Type'] = 'application/zip'
-    response.headers['Content-Disposition'] = f'attachment; filename=all_resumes_{job_id}.zip'
-    return response
+    return zip_response(entries, f'all_resumes_{job_id}.zip')
 
 @app.route('/api/download_resume', methods=['POST'])
 def download_resume_file():
@@ -618,42 +1238,48 @@ def download_all_filtered_resumes():
     if not filtered_resume_ids:
         return jsonify({"message": "No filtered resumes to download."}), 404
 
-    memory_file = BytesIO()
-    with zipfile.ZipFile(memory_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for resume_id in filtered_resume_ids:
-            result = screening_results_db.get(resume_id)
-            if result:
-                unique_filename_on_server = result.get('filepath')
-                original_filename = result.get('filename')
-
-                if unique_filename_on_server and original_filename:
-                    full_filepath = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename_on_server)
-                    if os.path.exists(full_filepath):
-                        # Security check: Ensure the file is within the UPLOAD_FOLDER
-                        if os.path.abspath(os.path.dirname(full_filepath)) == os.path.abspath(
-                                app.config['UPLOAD_FOLDER']):
-                            zf.write(full_filepath, arcname=original_filename)
-                        else:
-                            print(f"Skipping file outside UPLOAD_FOLDER: {full_filepath}")
+    # user_id and/or job_id pick the result set (the user's latest one without a job_id)
+    if not data.get('user_id') and not data.get('job_id'):
+        return jsonify({"message": "user_id or job_id is required"}), 400
+    result_set = get_result_set(data.get('user_id'), data.get('job_id'))
+    results_by_id = {result['resume_id']: result for result in result_set['results']} if result_set else {}
+
+    entries = []
+    for resume_id in filtered_resume_ids:
+        result = results_by_id.get(resume_id)
+        if result:
+            unique_filename_on_server = result.get('filepath')
+            original_filename = result.get('filename')
+
+            if unique_filename_on_server and original_filename:
+                full_filepath = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename_on_server)
+                if os.path.exists(full_filepath):
+                    # Security check: Ensure the file is within the UPLOAD_FOLDER
+                    if os.path.abspath(os.path.dirname(full_filepath)) == os.path.abspath(
+                            app.config['UPLOAD_FOLDER']):
+                        entries.append((full_filepath, original_filename))
                     else:
-                        print(f"File not found for resume_id {resume_id}: {full_filepath}")
+                        print(f"Skipping file outside UPLOAD_FOLDER: {full_filepath}")
                 else:
-                    print(f"Missing filename or filepath for resume_id {resume_id}")
+                    print(f"File not found for resume_id {resume_id}: {full_filepath}")
             else:
-                print(f"Resume ID {resume_id} not found in screening results for download.")
+                print(f"Missing filename or filepath for resume_id {resume_id}")
+        else:
+            print(f"Resume ID {resume_id} not found in screening results for download.")
 
-    memory_file.seek(0)
-    response = make_response(memory_file.getvalue())
-    response.headers['Content-Type'] = 'application/zip'
-    response.headers['Content-Disposition'] = 'attachment; filename=filtered_resumes.zip'
-    return response
+    return zip_response(entries, 'filtered_resumes.zip')
 
 @app.route('/api/clear_session_data', methods=['POST'])
 def clear_session_data():
-    global resumes_db, screening_results_db, job_requirements_db
-    resumes_db = {}
-    screening_results_db = {}
-    job_requirements_db = {}
+    resumes_db.clear()
+    resume_texts_db.clear()
+    resume_embeddings_db.clear()
+    resume_hash_index.clear()
+    screening_results_db.clear()
+    job_requirements_db.clear()
+    job_profiles.clear()
+    resume_index.clear()
+    skill_index.clear()
     print("Backend session data cleared.")
     return jsonify({"message": "Session data cleared successfully"}), 200
 
@@ -669,6 +1295,20 @@ def catch_all(path):
     return 'Page not found', 404
 
 
+# The embedding model and NLTK load lazily on first use, so workers boot fast and auth-only
+# requests never load them. PRELOAD_MODELS=1 loads them now instead: with `gunicorn --preload`
+# (see gunicorn.conf.py) that happens once in the master and the forked workers share the
+# weights copy-on-write. No encode is run here, as torch's thread pools are not fork-safe.
+PRELOAD_MODELS = os.environ.get("PRELOAD_MODELS", "0").lower() in ('1', 'true', 'yes')
+startup_timings = {}
+if PRELOAD_MODELS:
+    startup_timings['model_seconds'] = warm_up_matcher(run_encode=False)
+    startup_timings['nltk_seconds'] = warm_up_text_processor()
+startup_timings['total_seconds'] = time.perf_counter() - _startup_started
+print(f"App started in {startup_timings['total_seconds']:.2f}s "
+      f"({', '.join(f'{name} {seconds:.2f}s' for name, seconds in startup_timings.items() if name != 'total_seconds') or 'models load on first use'})")
+
+
 if __name__ == "__main__":
     # Use environment variable for PORT, default to 5000
     port = int(os.environ.get("PORT", 5000))
@@ -0,0 +1,73 @@
+# benchmarks/bench_embedding_backends.py
+# Compares the embedding backends on a fixed synthetic resume corpus: encoding throughput,
+# and how far each backend's embeddings and semantic scores drift from the torch model.
+# Run from the repository root: python -m benchmarks.bench_embedding_backends [--onnx-dir DIR]
+# Without an existing ONNX export, one is written to a temporary directory first.
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks.bench_skills import build_corpus
+from embedding_backends import EMBEDDING_BACKENDS, export_onnx, load_embedding_model
+from resume_matcher import MODEL_NAME, WEIGHT_SEMANTIC, _normalize_rows
+
+JOB_DESCRIPTION = ("Senior backend engineer with 5+ years of experience in python, sql, docker and aws, "
+                   "building data pipelines and REST APIs in an agile team.")
+
+
+def encode(model, texts, batch_size):
+    return _normalize_rows(np.asarray(model.encode(texts, batch_size=batch_size, convert_to_numpy=True),
+                                      dtype=np.float32))
+
+
+def time_encode(model, texts, batch_size, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        encode(model, texts, batch_size)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--model', default=MODEL_NAME)
+    parser.add_argument('--onnx-dir')
+    parser.add_argument('--documents', type=int, default=200)
+    parser.add_argument('--batch-size', type=int, default=32)
+    args = parser.parse_args()
+
+    corpus = build_corpus(num_documents=args.documents, words_per_document=150)
+    onnx_dir = args.onnx_dir
+
+    reference = None
+    print(f"documents: {len(corpus)}, batch size: {args.batch_size}")
+    print(f"{'backend':<10} {'docs/s':>8} {'min cos':>8} {'score drift (mean/max pts)':>27} {'top-10 overlap':>15}")
+    for backend in EMBEDDING_BACKENDS:
+        try:
+            if backend == 'onnx' and onnx_dir is None:
+                onnx_dir = tempfile.mkdtemp(prefix='onnx_model_')
+                export_onnx(load_embedding_model('torch', args.model), onnx_dir)
+            model = load_embedding_model(backend, args.model, onnx_dir)
+        except Exception as e:
+            print(f"{backend:<10} skipped: {e}")
+            continue
+
+        seconds = time_encode(model, corpus, args.batch_size)
+        embeddings = encode(model, corpus, args.batch_size)
+        # Points the semantic part contributes to the 0-100 match score, as in _combine_scores
+        scores = WEIGHT_SEMANTIC * (embeddings @ encode(model, [JOB_DESCRIPTION], 1)[0] + 1) / 2 * 100
+        if reference is None:
+            reference = (embeddings, scores)
+        reference_embeddings, reference_scores = reference
+        cosines = np.sum(embeddings * reference_embeddings, axis=1)
+        drift = np.abs(scores - reference_scores)
+        overlap = len(set(np.argsort(-scores)[:10]) & set(np.argsort(-reference_scores)[:10]))
+        print(f"{backend:<10} {len(corpus) / seconds:>8.1f} {cosines.min():>8.4f} "
+              f"{drift.mean():>13.3f} / {drift.max():<11.3f} {overlap:>12}/10")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_preprocess.py
+# Compares preprocess_text (compiled regexes, memoised lemmas) in both tokenizer modes with the
+# previous implementation, checks the NLTK mode still gives identical output, and reports tokens/sec.
+# Run from the repository root: python -m benchmarks.bench_preprocess
+import random
+import re
+import time
+
+import text_processor
+from benchmarks.bench_skills import build_corpus
+from text_processor import preprocess_text
+
+NOISE = ["https://github.com/someone/repo", "www.example.com", "@mention", "#hashtag", "e-mail:", "(2019–2023)",
+         "C#", "F#", "R&D", "naïve", "résumé", "under_score", "#1", "@", "&", "50%", "$120k", "Node.JS", "C++."]
+
+
+def legacy_preprocess_text(text):
+    # The previous implementation: four uncompiled re.sub passes and an uncached lemmatizer
+    text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
+    text = re.sub(r'@\w+|#\w+', '', text)
+    text = re.sub(r'[^a-zA-Z0-9\s\.\+\-]', '', text)
+    text = text.lower()
+    tokens = text_processor.word_tokenize(text)
+    processed_tokens = [text_processor.lemmatizer.lemmatize(word) for word in tokens
+                        if word not in text_processor.stop_words]
+    return " ".join(processed_tokens)
+
+
+def build_noisy_corpus(seed=7):
+    rng = random.Random(seed)
+    corpus = []
+    for document in build_corpus(num_documents=200, words_per_document=400):
+        words = document.split(" ")
+        for _ in range(40):
+            words.insert(rng.randrange(len(words)), rng.choice(NOISE))
+        corpus.append(" ".join(words).title() if rng.random() < 0.3 else " ".join(words))
+    return corpus
+
+
+def time_function(function, corpus, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        text_processor._lemmatize.cache_clear()  # every run starts with a cold lemma cache
+        start = time.perf_counter()
+        for document in corpus:
+            function(document)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    text_processor.warm_up()
+    corpus = build_noisy_corpus()
+    tokens = sum(len(text_processor.word_tokenize(document)) for document in corpus)
+    mismatches = sum(preprocess_text(document, tokenizer='nltk') != legacy_preprocess_text(document)
+                     for document in corpus)
+
+    timings = [
+        ("previous", time_function(legacy_preprocess_text, corpus)),
+        ("nltk mode", time_function(lambda document: preprocess_text(document, tokenizer='nltk'), corpus)),
+        ("regex mode", time_function(lambda document: preprocess_text(document, tokenizer='regex'), corpus)),
+    ]
+    print(f"documents: {len(corpus)}, tokens: {tokens}")
+    print(f"nltk mode output differing from previous: {mismatches}")
+    for name, seconds in timings:
+        print(f"{name:<11} {seconds * 1000:8.1f} ms  {tokens / seconds:>10,.0f} tokens/s  "
+              f"{timings[0][1] / seconds:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# benchmarks/bench_skills.py
+# Compares the single-pass skill matcher with the old one-regex-per-skill loop.
+# Run from the repository root: python -m benchmarks.bench_skills
+import random
+import re
+import time
+
+from text_processor import COMMON_SKILLS, extract_skills_from_text
+
+FILLER_WORDS = [
+    "led", "team", "delivered", "project", "using", "with", "and", "experience", "in",
+    "developed", "built", "years", "managed", "stakeholders", "nodejs", "node js", "c++11",
+    "shred", "r&d", "ui/ux", "e-commerce", "2019", "(python)", "react.", "vue js", "go-to",
+]
+
+
+def legacy_extract_skills_from_text(text):
+    # The previous implementation: one re.search per skill over the whole text
+    found_skills = []
+    processed_text = text.lower()
+    for skill in COMMON_SKILLS:
+        if re.search(r'\b' + re.escape(skill).replace('\\.', '[\\.\\s]?') + r'\b', processed_text):
+            found_skills.append(skill.replace('.', ''))
+    return list(set(found_skills))
+
+
+def build_corpus(num_documents=200, words_per_document=600, seed=42):
+    rng = random.Random(seed)
+    vocabulary = FILLER_WORDS * 10 + COMMON_SKILLS
+    separators = [" ", " ", " ", ", ", ".\n", "\t", " - "]
+    corpus = []
+    for _ in range(num_documents):
+        words = [rng.choice(vocabulary) for _ in range(words_per_document)]
+        corpus.append("".join(word + rng.choice(separators) for word in words))
+    return corpus
+
+
+def time_function(function, corpus, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for document in corpus:
+            function(document)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    corpus = build_corpus()
+    mismatches = sum(
+        set(extract_skills_from_text(document)) != set(legacy_extract_skills_from_text(document))
+        for document in corpus
+    )
+    legacy_seconds = time_function(legacy_extract_skills_from_text, corpus)
+    new_seconds = time_function(extract_skills_from_text, corpus)
+
+    print(f"documents:          {len(corpus)}")
+    print(f"mismatched results: {mismatches}")
+    print(f"regex loop:         {legacy_seconds * 1000:.1f} ms")
+    print(f"single pass:        {new_seconds * 1000:.1f} ms")
+    print(f"speedup:            {legacy_seconds / new_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# benchmarks/bench_startup.py
+# Measures how long a fresh worker takes to import the app, and to serve its first embedding,
+# with lazy model loading (the default) and with PRELOAD_MODELS=1.
+# Run from the repository root: python -m benchmarks.bench_startup
+import os
+import subprocess
+import sys
+
+MEASURE = """
+import time
+started = time.perf_counter()
+import app
+imported = time.perf_counter() - started
+started = time.perf_counter()
+try:
+    app.embed_resume_texts(["first request"])
+except Exception as e:
+    print(f"(embedding unavailable: {e})")
+first_embedding = time.perf_counter() - started
+print(f"{imported:.3f} {first_embedding:.3f}")
+"""
+
+
+def measure(preload, repeat=3):
+    env = dict(os.environ, PRELOAD_MODELS='1' if preload else '0')
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', MEASURE], env=env, capture_output=True, text=True,
+                                check=True).stdout.strip().splitlines()
+        timings.append(tuple(float(value) for value in output[-1].split()))
+    return min(timings)
+
+
+def main():
+    for preload in (False, True):
+        imported, first_embedding = measure(preload)
+        print(f"PRELOAD_MODELS={int(preload)}: import {imported:.2f}s, first embedding {first_embedding:.2f}s, "
+              f"total {imported + first_embedding:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# embedding_backends.py
+# Ways of running the sentence embedding model on CPU, chosen with EMBEDDING_BACKEND:
+#   torch      the SentenceTransformer model as is (default)
+#   quantized  the same model with its Linear layers dynamically quantized to int8
+#   onnx       an ONNX export of the model run by ONNX Runtime (pip install onnxruntime);
+#              create it once with: python -m embedding_backends export <directory>
+# Every backend offers SentenceTransformer's encode(texts, batch_size=..., convert_to_numpy=True).
+import os
+import sys
+
+import numpy as np
+
+EMBEDDING_BACKENDS = ('torch', 'quantized', 'onnx')
+
+# Directory holding model.onnx and the tokenizer files, as written by export_onnx()
+DEFAULT_ONNX_DIR = os.path.join(os.path.dirname(__file__), 'onnx_model')
+
+# Tokens per text; all-MiniLM-L6-v2 was trained with (and SentenceTransformer truncates to) 256
+ONNX_MAX_SEQ_LENGTH = 256
+
+
+class OnnxEmbeddingModel:
+    """Mean-pooled sentence embeddings from an ONNX export of a SentenceTransformer model."""
+
+    def __init__(self, onnx_dir, max_seq_length=ONNX_MAX_SEQ_LENGTH, num_threads=None):
+        import onnxruntime
+        from transformers import AutoTokenizer
+
+        options = onnxruntime.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = onnxruntime.InferenceSession(os.path.join(onnx_dir, 'model.onnx'), options,
+                                                    providers=['CPUExecutionProvider'])
+        self.tokenizer = AutoTokenizer.from_pretrained(onnx_dir)
+        self.max_seq_length = max_seq_length
+        self._input_names = {model_input.name for model_input in self.session.get_inputs()}
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, **kwargs):
+        embeddings = []
+        for start in range(0, len(texts), batch_size):
+            encoded = self.tokenizer(list(texts[start:start + batch_size]), padding=True, truncation=True,
+                                     max_length=self.max_seq_length, return_tensors='np')
+            inputs = {name: encoded[name].astype(np.int64) for name in encoded if name in self._input_names}
+            token_embeddings = self.session.run(None, inputs)[0]
+            # Mean pooling over the real (non-padding) tokens, as the SentenceTransformer model does
+            mask = encoded['attention_mask'][..., None].astype(np.float32)
+            embeddings.append((token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None))
+        if not embeddings:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.vstack(embeddings).astype(np.float32)
+
+
+def quantize_model(model):
+    # int8 weights for every Linear layer; activations are quantized on the fly per batch
+    import torch
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def export_onnx(model, onnx_dir):
+    """Write `model` (a SentenceTransformer) as onnx_dir/model.onnx plus its tokenizer files."""
+    import torch
+
+    class TokenEmbeddings(torch.nn.Module):
+        # Fixes the argument order (forward signatures differ between transformers versions)
+        # and returns only the token embeddings the pooling needs
+        def __init__(self, auto_model, input_names):
+            super().__init__()
+            self.auto_model = auto_model
+            self.input_names = input_names
+
+        def forward(self, *inputs):
+            return self.auto_model(**dict(zip(self.input_names, inputs)))[0]
+
+    transformer = model[0]
+    os.makedirs(onnx_dir, exist_ok=True)
+    transformer.tokenizer.save_pretrained(onnx_dir)
+    sample = transformer.tokenizer(["an example resume"], return_tensors='pt')
+    input_names = [name for name in ('input_ids', 'attention_mask', 'token_type_ids') if name in sample]
+    dynamic_axes = {name: {0: 'batch', 1: 'sequence'} for name in input_names}
+    dynamic_axes['last_hidden_state'] = {0: 'batch', 1: 'sequence'}
+    transformer.auto_model.eval()
+    with torch.no_grad():
+        torch.onnx.export(TokenEmbeddings(transformer.auto_model, input_names),
+                          tuple(sample[name] for name in input_names), os.path.join(onnx_dir, 'model.onnx'), input_names=input_names,
+                          output_names=['last_hidden_state'], dynamic_axes=dynamic_axes,
+                          opset_version=17, dynamo=False)
+
+
+def load_embedding_model(backend, model_name, onnx_dir=None):
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"Unknown EMBEDDING_BACKEND: {backend}")
+    if backend == 'onnx':
+        return OnnxEmbeddingModel(onnx_dir or DEFAULT_ONNX_DIR)
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(model_name, device='cpu')
+    if backend == 'quantized':
+        model = quantize_model(model)
+    return model
+
+
+if __name__ == "__main__":
+    # python -m embedding_backends export [directory]
+    if len(sys.argv) < 2 or sys.argv[1] != 'export':
+        sys.exit("usage: python -m embedding_backends export [directory]")
+    from resume_matcher import MODEL_NAME
+    target_dir = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_ONNX_DIR
+    export_onnx(load_embedding_model('torch', MODEL_NAME), target_dir)
+    print(f"Exported {MODEL_NAME} to {target_dir}")
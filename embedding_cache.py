@@ -0,0 +1,215 @@
+# embedding_cache.py
+import base64
+import fcntl
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+
+def embedding_key(text, model_name):
+    # Content-addressed key: the same text embedded by the same model always maps to the same entry
+    return hashlib.sha256(f"{model_name}\0{text}".encode('utf-8')).hexdigest()
+
+
+def vector_to_text(vector):
+    # float32 vector as compact base64, for storing embeddings in JSON-valued stores
+    return base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode('ascii')
+
+
+def vector_from_text(text):
+    return np.frombuffer(base64.b64decode(text), dtype=np.float32)
+
+
+class EmbeddingCache:
+    """LRU cache of float32 embedding vectors keyed by embedding_key().
+
+    Vectors live in one preallocated (max_entries x dim) matrix. When `path` is given the
+    matrix is a numpy memmap backed by that file and the key -> slot index is kept next to
+    it as JSON, so every process pointed at the same path (gunicorn workers, a restarted
+    worker) shares one set of embeddings. Slot allocation and index writes happen under an
+    exclusive flock on `path`.lock; the lock file holds a generation counter bumped on every
+    write, and a process reloads the index whenever the generation has moved on.
+    """
+
+    def __init__(self, max_entries=5000, path=None):
+        self.max_entries = max_entries
+        self.path = path
+        self.dim = None
+        self._vectors = None
+        self._slots = OrderedDict()  # key -> row in self._vectors, least recently used first
+        self._free_slots = []
+        self._touched = set()  # keys read since this process last wrote the shared index
+        self._lock = threading.Lock()
+        self._lock_fd = None
+        self._lock_fd_pid = None
+        self._generation = None  # generation of the shared index last loaded
+
+    def _index_path(self):
+        return f"{self.path}.index.json"
+
+    def _allocate(self, dim, max_entries):
+        self.dim = dim
+        self.max_entries = max_entries
+        if self.path:
+            # Create or extend the file without ever truncating it: other processes may be
+            # reading rows of it right now
+            with open(self.path, 'ab') as f:
+                if os.fstat(f.fileno()).st_size < max_entries * dim * 4:
+                    f.truncate(max_entries * dim * 4)
+            self._vectors = np.memmap(self.path, dtype=np.float32, mode='r+', shape=(max_entries, dim))
+        else:
+            self._vectors = np.zeros((max_entries, dim), dtype=np.float32)
+        self._free_slots = list(range(max_entries - 1, -1, -1))
+
+    def _open_lock_file(self):
+        # flock locks belong to the open file, which a forked worker would share with its
+        # parent, so every process opens the lock file itself
+        if self._lock_fd is None or self._lock_fd_pid != os.getpid():
+            self._lock_fd = os.open(f"{self.path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            self._lock_fd_pid = os.getpid()
+        return self._lock_fd
+
+    def _read_generation(self, fd):
+        data = os.pread(fd, 8, 0)
+        return int.from_bytes(data, 'little') if len(data) == 8 else 0
+
+    @contextmanager
+    def _file_lock(self, exclusive):
+        fd = self._open_lock_file()
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            generation = self._read_generation(fd)
+            if generation != self._generation:
+                self._load()
+                self._generation = generation
+            yield fd
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _load(self):
+        # Replace this process's view with the shared index (called with the file lock held)
+        self._slots = OrderedDict()
+        if not os.path.exists(self._index_path()):
+            if self._vectors is not None:
+                self._free_slots = list(range(self.max_entries - 1, -1, -1))
+            return
+        try:
+            with open(self._index_path()) as f:
+                index = json.load(f)
+            if index['max_entries'] != self.max_entries and self._generation is None:
+                print(f"Embedding cache {self.path} holds {index['max_entries']} entries; using that size.")
+            if self._vectors is None or (index['dim'], index['max_entries']) != self._vectors.shape:
+                self._allocate(index['dim'], index['max_entries'])
+            for key, slot in index['slots']:
+                self._slots[key] = slot
+            for key in self._touched:
+                if key in self._slots:
+                    self._slots.move_to_end(key)
+            used = set(self._slots.values())
+            self._free_slots = [slot for slot in range(self.max_entries - 1, -1, -1) if slot not in used]
+        except Exception as e:
+            print(f"Could not load embedding cache index {self._index_path()}: {e}. Starting empty.")
+            self._slots = OrderedDict()
+            if self._vectors is not None:
+                self._free_slots = list(range(self.max_entries - 1, -1, -1))
+
+    def _write_index(self, fd):
+        # Called with the exclusive file lock held: vectors first, then the index that points at them
+        self._vectors.flush()
+        index = {'dim': self.dim, 'max_entries': self.max_entries, 'slots': list(self._slots.items())}
+        tmp_path = f"{self._index_path()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self._index_path())
+        self._generation = self._read_generation(fd) + 1
+        os.pwrite(fd, self._generation.to_bytes(8, 'little'), 0)
+        self._touched.clear()
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def get(self, key):
+        return self.get_many([key])[0]
+
+    def get_many(self, keys):
+        # One vector (or None) per key, read under a single lock
+        with self._lock:
+            if not self.path:
+                return self._get_items(keys)
+            with self._file_lock(exclusive=False):
+                return self._get_items(keys)
+
+    def _get_items(self, keys):
+        vectors = []
+        for key in keys:
+            slot = self._slots.get(key)
+            if slot is None:
+                vectors.append(None)
+                continue
+            self._slots.move_to_end(key)
+            if self.path:
+                self._touched.add(key)
+            vectors.append(np.array(self._vectors[slot]))
+        return vectors
+
+    def put(self, key, vector):
+        self.put_many([(key, vector)])
+
+    def put_many(self, items):
+        # Stores (key, vector) pairs; with a path they are published to the shared index in one write
+        items = [(key, np.asarray(vector, dtype=np.float32)) for key, vector in items]
+        if not items:
+            return
+        with self._lock:
+            if not self.path:
+                self._put_items(items)
+                return
+            with self._file_lock(exclusive=True) as fd:
+                self._put_items(items)
+                self._write_index(fd)
+
+    def _put_items(self, items):
+        if self._vectors is None:
+            self._allocate(items[0][1].shape[0], self.max_entries)
+        for key, vector in items:
+            if vector.shape[0] != self.dim:
+                raise ValueError(f"Embedding of dimension {vector.shape[0]} does not fit a cache of dimension {self.dim}")
+            if key in self._slots:
+                slot = self._slots[key]
+                self._slots.move_to_end(key)
+            else:
+                if not self._free_slots:
+                    # Evict the least recently used entry and reuse its row
+                    _, slot = self._slots.popitem(last=False)
+                else:
+                    slot = self._free_slots.pop()
+                self._slots[key] = slot
+            self._vectors[slot] = vector
+
+    def flush(self):
+        # put_many() already publishes every write; this only forces the vectors to disk
+        if not self.path or self._vectors is None:
+            return
+        with self._lock:
+            self._vectors.flush()
+
+    def clear(self):
+        with self._lock:
+            if not self.path:
+                self._slots.clear()
+                if self._vectors is not None:
+                    self._free_slots = list(range(self.max_entries - 1, -1, -1))
+                return
+            with self._file_lock(exclusive=True) as fd:
+                self._slots.clear()
+                if self._vectors is not None:
+                    self._free_slots = list(range(self.max_entries - 1, -1, -1))
+                    self._write_index(fd)
@@ -0,0 +1,7 @@
+# gunicorn.conf.py (gunicorn reads this automatically from the working directory)
+import os
+
+# With PRELOAD_MODELS=1 the app, and with it the embedding model and NLTK, is loaded once in
+# the master process before the workers are forked, so they share the model weights
+# copy-on-write instead of each loading a copy
+preload_app = os.environ.get("PRELOAD_MODELS", "0").lower() in ('1', 'true', 'yes')
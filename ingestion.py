@@ -0,0 +1,106 @@
+# ingestion.py
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from text_extractor import extract_pages_from_file
+from text_processor import analyze_document
+
+# Worker processes used for text extraction and NLP; 1 (or less) runs everything inline
+DEFAULT_INGEST_WORKERS = int(os.environ.get("INGEST_WORKERS", os.cpu_count() or 1))
+
+# Optional extraction budget: stop reading a resume after this many PDF pages / characters
+RESUME_MAX_PAGES = int(os.environ["RESUME_MAX_PAGES"]) if os.environ.get("RESUME_MAX_PAGES") else None
+RESUME_MAX_CHARS = int(os.environ["RESUME_MAX_CHARS"]) if os.environ.get("RESUME_MAX_CHARS") else None
+
+# Pool workers are started by a clean fork server (or spawned) rather than forked from this
+# process, which may already run torch/tokenizer threads (e.g. a preloaded gunicorn worker);
+# forking a multi-threaded process can leave a child blocked on a lock no thread will release
+_MP_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def process_resume_file(source, filename=None):
+    # Runs every CPU-bound stage for one resume; executed inside a pool worker.
+    # `source` is a path or the uploaded file's bytes (then `filename` gives the format).
+    pages = extract_pages_from_file(source, max_pages=RESUME_MAX_PAGES, max_chars=RESUME_MAX_CHARS,
+                                    filename=filename)
+    raw_text = "".join(pages)
+    # Character offset in raw_text where each page (PDF) or paragraph (DOCX) starts
+    page_offsets = []
+    offset = 0
+    for page in pages:
+        page_offsets.append(offset)
+        offset += len(page)
+    analysis = analyze_document(raw_text)
+    return {
+        'raw_text': raw_text,
+        'processed_text': analysis['processed_text'],
+        'extracted_skills': analysis['extracted_skills'],
+        'categorized_field': analysis['categorized_field'],
+        'category_scores': analysis['category_scores'],
+        'experience_profile': analysis['experience_profile'],
+        'page_offsets': page_offsets
+    }
+
+
+def _get_executor(max_workers):
+    # One long-lived pool per process, so worker start-up is paid once and not per upload
+    global _executor
+    with _executor_lock:
+        if _executor is None or _executor._max_workers != max_workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=_MP_CONTEXT)
+        return _executor
+
+
+def _discard_executor(executor):
+    # A worker died (e.g. OOM-killed); a broken pool rejects all further work, so start afresh
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+
+
+def _process_safely(source, filename):
+    try:
+        return process_resume_file(source, filename), None
+    except Exception as e:
+        print(f"Error processing resume {filename}: {e}")
+        return None, str(e)
+
+
+def ingest_resume_files(sources, filenames=None, max_workers=DEFAULT_INGEST_WORKERS):
+    """Extract and analyse many resumes, fanning out over a process pool.
+
+    `sources` are file paths or raw file bytes; `filenames` (needed for bytes) gives each
+    one's name. Returns a list of (resume_fields, error) tuples in the same order as
+    `sources`. A file that fails gets (None, error message) without affecting the rest.
+    """
+    if filenames is None:
+        filenames = list(sources)
+    if max_workers <= 1 or len(sources) <= 1:
+        return [_process_safely(source, filename) for source, filename in zip(sources, filenames)]
+
+    executor = _get_executor(max_workers)
+    futures = [executor.submit(process_resume_file, source, filename)
+               for source, filename in zip(sources, filenames)]
+    results = []
+    for filename, future in zip(filenames, futures):
+        try:
+            results.append((future.result(), None))
+        except BrokenProcessPool as e:
+            _discard_executor(executor)
+            print(f"Resume worker pool broke while processing {filename}: {e}")
+            results.append((None, "Resume processing worker crashed"))
+        except Exception as e:
+            print(f"Error processing resume {filename}: {e}")
+            results.append((None, str(e)))
+    return results
@@ -0,0 +1,105 @@
+# result_cache.py
+import threading
+import time
+
+
+# Presorted orders stored with each result set, so pages can be served without re-sorting.
+# Python's sort is stable, so ties keep the order the resumes were screened in.
+RESULT_ORDERS = {
+    'score': lambda results: sorted(range(len(results)), key=lambda i: results[i]['match_score'], reverse=True),
+    'name': lambda results: sorted(range(len(results)), key=lambda i: results[i]['filename'])
+}
+
+
+class ResultSetCache:
+    """Screening results kept per (user_id, job_id) on top of two store namespaces.
+
+    `sets` holds each result set; `index` holds a small {created_at, size} entry per set,
+    so expiry and eviction never have to load the result sets themselves. Sets expire
+    after `ttl_seconds`, and the oldest sets are evicted once more than `max_results`
+    results are held in total.
+
+    Each set also carries `orders`: for every key of RESULT_ORDERS, the result positions
+    in that order, computed once when the set is stored.
+    """
+
+    def __init__(self, sets, index, ttl_seconds=7200, max_results=50000):
+        self._sets = sets
+        self._index = index
+        self._lock = threading.Lock()
+        self.ttl_seconds = ttl_seconds
+        self.max_results = max_results
+
+    @staticmethod
+    def _key(user_id, job_id):
+        return f"{user_id}:{job_id}"
+
+    def put(self, user_id, job_id, results):
+        key = self._key(user_id, job_id)
+        created_at = time.time()
+        with self._lock:
+            self._sets[key] = {
+                'user_id': user_id,
+                'job_id': job_id,
+                'created_at': created_at,
+                'results': results,
+                'orders': {name: build(results) for name, build in RESULT_ORDERS.items()}
+            }
+            self._index[key] = {'user_id': user_id, 'job_id': job_id, 'created_at': created_at, 'size': len(results)}
+            self._evict()
+
+    def get(self, user_id, job_id):
+        key = self._key(user_id, job_id)
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        if self._expired(entry):
+            self._delete(key)
+            return None
+        return self._sets.get(key)
+
+    def latest(self, user_id):
+        # This user's most recent live result set
+        entries = [entry for entry in self._index.values()
+                   if not self._expired(entry) and entry['user_id'] == user_id]
+        if not entries:
+            return None
+        newest = max(entries, key=lambda entry: entry['created_at'])
+        return self._sets.get(self._key(newest['user_id'], newest['job_id']))
+
+    @staticmethod
+    def order(result_set, sort_by):
+        # Result positions in `sort_by` order; computed here for sets stored without orders
+        orders = result_set.get('orders') or {}
+        if sort_by in orders:
+            return orders[sort_by]
+        return RESULT_ORDERS[sort_by](result_set['results'])
+
+    def clear(self):
+        with self._lock:
+            self._sets.clear()
+            self._index.clear()
+
+    def _expired(self, entry):
+        return time.time() - entry['created_at'] > self.ttl_seconds
+
+    def _delete(self, key):
+        self._sets.pop(key, None)
+        self._index.pop(key, None)
+
+    def _evict(self):
+        # Called with the lock held: drop expired sets, then the oldest until under the cap
+        entries = sorted(self._index.items(), key=lambda item: item[1]['created_at'])
+        total_results = 0
+        live_entries = []
+        for key, entry in entries:
+            if self._expired(entry):
+                self._delete(key)
+            else:
+                live_entries.append((key, entry))
+                total_results += entry['size']
+        for key, entry in live_entries[:-1]:  # never evict the set that was just stored
+            if total_results <= self.max_results:
+                break
+            self._delete(key)
+            total_results -= entry['size']
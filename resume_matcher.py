@@ -1,63 +1,255 @@
 # resume_matcher.py
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
-import re
-import requests
-import json
-from sentence_transformers import SentenceTransformer
+import os
+import threading
+import time
+from embedding_cache import EmbeddingCache, embedding_key
+from embedding_backends import EMBEDDING_BACKENDS, load_embedding_model
+from text_processor import SENIORITY_KEYWORD_SCORES, SENIORITY_KEYWORDS, extract_experience_profile, seniority_mask
 
-# Load a pre-trained Sentence Transformer model for BERT embeddings
+# Pre-trained Sentence Transformer model for BERT embeddings
 # This model is relatively small but effective for semantic similarity.
 # You might need to install it: pip install sentence-transformers
-try:
-    model = SentenceTransformer('all-MiniLM-L6-v2')
-except Exception as e:
-    print(f"Could not load SentenceTransformer model: {e}. Semantic similarity will fall back to TF-IDF.")
-    model = None
+# sentence_transformers (and torch) take seconds to import, so the model is only loaded on
+# first use via get_model(), or up front by warm_up() (e.g. before gunicorn forks its workers).
+MODEL_NAME = 'all-MiniLM-L6-v2'
 
-# This function will be called from app.py
-def calculate_match_score_enhanced(job_description_text, required_skills, experience_required,
-                                    resume_processed_text, resume_extracted_skills, hf_api_key=None):
-    # Weights for different components (adjusted for higher scores and skill emphasis)
-    WEIGHT_SEMANTIC = 0.35 # Slightly reduced
-    WEIGHT_SKILL_MATCH = 0.45 # Increased emphasis on skills
-    WEIGHT_EXPERIENCE = 0.20
+# How the model is run on CPU: torch (default), quantized (int8) or onnx; see embedding_backends.py
+EMBEDDING_BACKEND = os.environ.get("EMBEDDING_BACKEND", "torch").lower()
+if EMBEDDING_BACKEND not in EMBEDDING_BACKENDS:
+    raise ValueError(f"Unknown EMBEDDING_BACKEND: {EMBEDDING_BACKEND}")
+EMBEDDING_ONNX_DIR = os.environ.get("EMBEDDING_ONNX_DIR")
+# Backends produce slightly different vectors, so each gets its own embedding cache entries
+EMBEDDING_MODEL_ID = MODEL_NAME if EMBEDDING_BACKEND == 'torch' else f"{MODEL_NAME}+{EMBEDDING_BACKEND}"
 
-    # 1. Semantic Similarity using BERT Embeddings (or TF-IDF fallback)
-    semantic_similarity = 0.0
-    if model:
+_model = None
+_model_loaded = False
+_model_lock = threading.Lock()
+
+# Weights for different components (adjusted for higher scores and skill emphasis)
+WEIGHT_SEMANTIC = 0.35 # Slightly reduced
+WEIGHT_SKILL_MATCH = 0.45 # Increased emphasis on skills
+WEIGHT_EXPERIENCE = 0.20
+
+# text_processor.SENIORITY_KEYWORD_SCORES indexed by seniority mask bit
+_SENIORITY_BIT_SCORES = list(SENIORITY_KEYWORD_SCORES.values())
+# Experience score for every possible common (job & resume) seniority mask: that of the lowest
+# set bit, or neutral (0.5) when no keyword is shared
+_SENIORITY_MASK_SCORES = np.array(
+    [_SENIORITY_BIT_SCORES[(mask & -mask).bit_length() - 1] if mask else 0.5
+     for mask in range(1 << len(SENIORITY_KEYWORDS))]
+)
+
+# Number of resumes handed to model.encode at a time when scoring in batch
+DEFAULT_BATCH_SIZE = 32
+
+# MiniLM only reads the first 256 word pieces of a text. With EMBEDDING_CHUNK_WORDS set (e.g. 160),
+# longer resumes are split into windows of that many words overlapping by EMBEDDING_CHUNK_OVERLAP,
+# every chunk is embedded, and the chunk similarities are pooled with EMBEDDING_POOLING (max or mean).
+EMBEDDING_CHUNK_WORDS = int(os.environ.get("EMBEDDING_CHUNK_WORDS", 0))
+EMBEDDING_CHUNK_OVERLAP = int(os.environ.get("EMBEDDING_CHUNK_OVERLAP", 32))
+EMBEDDING_POOLING = os.environ.get("EMBEDDING_POOLING", "max").lower()
+if EMBEDDING_POOLING not in ('max', 'mean'):
+    raise ValueError(f"Unknown EMBEDDING_POOLING: {EMBEDDING_POOLING}")
+if EMBEDDING_CHUNK_WORDS and not 0 <= EMBEDDING_CHUNK_OVERLAP < EMBEDDING_CHUNK_WORDS:
+    raise ValueError(f"EMBEDDING_CHUNK_OVERLAP ({EMBEDDING_CHUNK_OVERLAP}) must be at least 0 and less than "
+                     f"EMBEDDING_CHUNK_WORDS ({EMBEDDING_CHUNK_WORDS})")
+# Identifies what embed_resume_texts() produces, so stored resume embeddings from another
+# model, backend or chunking setup are recognised as stale
+RESUME_EMBEDDING_ID = (f"{EMBEDDING_MODEL_ID}/chunks={EMBEDDING_CHUNK_WORDS},{EMBEDDING_CHUNK_OVERLAP}"
+                       if EMBEDDING_CHUNK_WORDS else EMBEDDING_MODEL_ID)
+
+# Unit-normalised embeddings keyed by a hash of (model name, text), so a resume is only
+# encoded once no matter how many jobs it is screened against.
+# Set EMBEDDING_CACHE_PATH to back the cache with a memory-mapped file shared by every worker.
+embedding_cache = EmbeddingCache(
+    max_entries=int(os.environ.get("EMBEDDING_CACHE_SIZE", 5000)),
+    path=os.environ.get("EMBEDDING_CACHE_PATH")
+)
+
+
+def get_model():
+    """Return the embedding model for EMBEDDING_BACKEND, loading it on first call; None if it cannot be loaded."""
+    global _model, _model_loaded
+    if not _model_loaded:
+        with _model_lock:
+            if not _model_loaded:
+                try:
+                    _model = load_embedding_model(EMBEDDING_BACKEND, MODEL_NAME, EMBEDDING_ONNX_DIR)
+                except Exception as e:
+                    print(f"Could not load the {EMBEDDING_BACKEND} embedding model: {e}. Semantic similarity will fall back to TF-IDF.")
+                    _model = None
+                _model_loaded = True
+    return _model
+
+
+def warm_up(run_encode=True):
+    # Loads the model and (optionally) runs one encode so the first request does not pay
+    # for it. Returns the seconds taken.
+    started = time.perf_counter()
+    model = get_model()
+    if model is not None and run_encode:
+        model.encode(["warm up"], convert_to_numpy=True)
+    return time.perf_counter() - started
+
+
+class TfidfFallback:
+    """TF-IDF semantic similarity for when embeddings are unavailable.
+
+    The vectorizer is fitted once, on first use, over the job description(s) and every resume
+    text of a screening, so resumes scored in different chunks share the same IDF statistics
+    and stay comparable in one ranking. Only the transform and the product run per chunk.
+    """
+
+    def __init__(self, job_descriptions, resume_texts):
+        self._documents = list(job_descriptions) + list(resume_texts)
+        self._vectorizer = None
+        self._fitted = False
+
+    def _fit(self):
+        if not self._fitted:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            try:
+                self._vectorizer = TfidfVectorizer().fit(self._documents)
+            except ValueError as e: # e.g. empty vocabulary: nothing to compare
+                print(f"TF-IDF fallback failed: {e}")
+            self._documents = None
+            self._fitted = True
+        return self._vectorizer
+
+    def similarities(self, job_description_text, resume_texts):
+        # Rows come out L2-normalised, so every cosine similarity is one entry of a single
+        # sparse matrix-vector product
+        vectorizer = self._fit()
+        if vectorizer is None or not len(resume_texts):
+            return np.zeros(len(resume_texts))
+        job_vector = vectorizer.transform([job_description_text])
+        return (vectorizer.transform(resume_texts) @ job_vector.T).toarray().ravel()
+
+
+def _normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def embed_texts(texts, batch_size=DEFAULT_BATCH_SIZE):
+    """Return a float32 matrix of unit-normalised embeddings, one row per text.
+
+    Only texts missing from embedding_cache are encoded; raises if the model is unavailable.
+    """
+    model = get_model()
+    if model is None:
+        raise RuntimeError("SentenceTransformer model is not loaded")
+
+    keys = [embedding_key(text, EMBEDDING_MODEL_ID) for text in texts]
+    vectors = embedding_cache.get_many(keys)
+
+    # Encode each distinct missing text once, even if it repeats within the batch
+    missing = {}
+    for i, vector in enumerate(vectors):
+        if vector is None:
+            missing.setdefault(keys[i], texts[i])
+    if missing:
+        encoded = model.encode(list(missing.values()), batch_size=batch_size, convert_to_numpy=True)
+        encoded = _normalize_rows(np.asarray(encoded, dtype=np.float32))
+        computed = dict(zip(missing.keys(), encoded))
+        embedding_cache.put_many(computed.items())
+        vectors = [computed[key] if vector is None else vector for key, vector in zip(keys, vectors)]
+
+    if not vectors:
+        return np.zeros((0, embedding_cache.dim or 0), dtype=np.float32)
+    return np.vstack(vectors)
+
+
+def chunk_text(text, chunk_words=EMBEDDING_CHUNK_WORDS, overlap=EMBEDDING_CHUNK_OVERLAP):
+    # Overlapping windows of chunk_words words; a text that fits in one window is returned whole
+    words = text.split()
+    if not chunk_words or len(words) <= chunk_words:
+        return [text]
+    if not 0 <= overlap < chunk_words:
+        raise ValueError(f"overlap ({overlap}) must be at least 0 and less than chunk_words ({chunk_words})")
+    step = chunk_words - overlap
+    return [" ".join(words[start:start + chunk_words]) for start in range(0, max(len(words) - overlap, 1), step)]
+
+
+def _embed_chunks(texts, batch_size=DEFAULT_BATCH_SIZE):
+    # Embeds every chunk of every text in one embed_texts call; returns the chunk embeddings
+    # and, per text, the index of its first chunk (chunks of one text are contiguous)
+    chunks = []
+    starts = []
+    for text in texts:
+        starts.append(len(chunks))
+        chunks.extend(chunk_text(text))
+    return embed_texts(chunks, batch_size), np.array(starts, dtype=np.intp)
+
+
+def embed_resume_texts(texts, batch_size=DEFAULT_BATCH_SIZE):
+    """One unit-normalised embedding per resume text, for similarity search.
+
+    Without chunking this is embed_texts(); with chunking it is the normalised mean of the
+    resume's chunk embeddings. Either way the embeddings land in embedding_cache for screening.
+    """
+    if not EMBEDDING_CHUNK_WORDS:
+        return embed_texts(texts, batch_size)
+    if not texts:
+        return embed_texts([], batch_size)
+    chunk_embeddings, starts = _embed_chunks(texts, batch_size)
+    counts = np.diff(np.append(starts, len(chunk_embeddings)))
+    return _normalize_rows(np.add.reduceat(chunk_embeddings, starts, axis=0) / counts[:, None])
+
+
+def _semantic_similarities(job_profile, resume_texts, batch_size=DEFAULT_BATCH_SIZE, tfidf=None,
+                           resume_embeddings=None):
+    return _semantic_similarity_matrix([job_profile], resume_texts, batch_size, tfidf, resume_embeddings)[0]
+
+
+def _semantic_similarity_matrix(job_profiles, resume_texts, batch_size=DEFAULT_BATCH_SIZE, tfidf=None,
+                                resume_embeddings=None):
+    # (jobs x resumes) similarities. Reuse the job embeddings from the compiled profiles and the
+    # resume embeddings (`resume_embeddings` when given, else cached or encoded), then get every
+    # cosine similarity from a single matrix product. `resume_embeddings` is ignored with
+    # chunking, which pools per-chunk similarities instead. The TF-IDF fallback uses `tfidf`
+    # (a TfidfFallback) when given, else one fitted on this batch.
+    if get_model():
         try:
-            embeddings = model.encode([job_description_text, resume_processed_text])
-            semantic_similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
+            job_embeddings = np.vstack([
+                job_profile['embedding'] if job_profile['embedding'] is not None
+                else embed_texts([job_profile['job_description']])[0]
+                for job_profile in job_profiles
+            ])
+            if EMBEDDING_CHUNK_WORDS and resume_texts:
+                # Score every chunk, then pool each resume's chunk similarities
+                chunk_embeddings, starts = _embed_chunks(resume_texts, batch_size)
+                chunk_similarities = job_embeddings @ chunk_embeddings.T
+                if EMBEDDING_POOLING == 'max':
+                    return np.maximum.reduceat(chunk_similarities, starts, axis=1)
+                counts = np.diff(np.append(starts, chunk_similarities.shape[1]))
+                return np.add.reduceat(chunk_similarities, starts, axis=1) / counts
+            if resume_embeddings is None:
+                resume_embeddings = embed_texts(resume_texts, batch_size)
+            return job_embeddings @ np.asarray(resume_embeddings, dtype=np.float32).T
         except Exception as e:
             print(f"Error with SentenceTransformer embeddings: {e}. Falling back to TF-IDF.")
-            # Fallback to TF-IDF if BERT model fails
-            documents = [job_description_text, resume_processed_text]
-            tfidf_vectorizer = TfidfVectorizer()
-            tfidf_matrix = tfidf_vectorizer.fit_transform(documents)
-            semantic_similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-    else:
-        # Fallback to TF-IDF if SentenceTransformer model was not loaded
-        documents = [job_description_text, resume_processed_text]
-        tfidf_vectorizer = TfidfVectorizer()
-        tfidf_matrix = tfidf_vectorizer.fit_transform(documents)
-        semantic_similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-
-    # Normalize semantic similarity to be between 0 and 1
-    # A common practice is to scale from [-1, 1] to [0, 1]
-    semantic_similarity = (semantic_similarity + 1) / 2
+    if tfidf is None:
+        tfidf = TfidfFallback([job_profile['job_description'] for job_profile in job_profiles], resume_texts)
+    return np.vstack([tfidf.similarities(job_profile['job_description'], resume_texts)
+                      for job_profile in job_profiles])
 
 
-    # 2. Skill Matching (Rule-based)
-    required_skills_set = set([skill.lower() for skill in required_skills])
+def _skill_match(required_skills_set, resume_extracted_skills):
+    resume_skills_set = set([es.lower() for es in resume_extracted_skills])
     matched_required_skills = [
         skill for skill in required_skills_set
-        if skill in [es.lower() for es in resume_extracted_skills]
+        if skill in resume_skills_set
     ]
+    return _skill_match_percentage(len(matched_required_skills), len(required_skills_set)), matched_required_skills
+
+
+def _skill_match_percentage(matched_count, required_count):
     skill_match_percentage = 0
-    if len(required_skills_set) > 0:
-        skill_match_percentage = len(matched_required_skills) / len(required_skills_set)
+    if required_count > 0:
+        skill_match_percentage = matched_count / required_count
 
     # Apply a boost for skill match if it's high
     if skill_match_percentage > 0.7:
@@ -65,28 +257,20 @@ def calculate_match_score_enhanced(job_description_text, required_skills, experi
     elif skill_match_percentage < 0.3:
         skill_match_percentage *= 0.8 # Penalize low skill match
 
+    return skill_match_percentage
 
-    # 3. Experience Matching (Rule-based)
+
+def _experience_score(job_profile, experience_profile):
+    # experience_profile is a resume's extract_experience_profile() tuple
     experience_score = 0.0
-    if experience_required and experience_required != "Any":
-        job_min_exp, job_max_exp = 0, float('inf')
-        if '-' in experience_required:
-            parts = experience_required.split('-')
-            job_min_exp = int(parts[0])
-            job_max_exp = int(parts[1].replace('+', '')) if '+' in parts[1] else int(parts[1])
-        elif '+' in experience_required:
-            job_min_exp = int(experience_required.replace('+', ''))
-
-        # Attempt to extract experience from resume text
-        # Improved regex to capture various formats like "X years experience", "X+ years", "X-Y years"
-        resume_experience_match = re.search(
-            r'(\d+)(?:\s*-\s*(\d+))?\+?\s*(?:year|yr)s?(?:\s*of)?\s*experience',
-            resume_processed_text
-        )
-        if resume_experience_match:
-            resume_min_years = int(resume_experience_match.group(1))
-            resume_max_years = int(resume_experience_match.group(2)) if resume_experience_match.group(2) else resume_min_years
+    if job_profile['experience_range'] is not None:
+        job_min_exp, job_max_exp = job_profile['experience_range']
+        resume_min_years, resume_max_years, span_years, resume_seniority_mask = experience_profile
 
+        # Stated years of experience, or else the years covered by the resume's date spans
+        if resume_min_years is None and span_years:
+            resume_min_years = resume_max_years = span_years
+        if resume_min_years is not None:
             # Check for overlap or direct match
             if (job_min_exp <= resume_max_years and job_max_exp >= resume_min_years):
                 experience_score = 1.0 # Good overlap
@@ -97,26 +281,22 @@ def calculate_match_score_enhanced(job_description_text, required_skills, experi
             else:
                 experience_score = 0.5 # Partial overlap or hard to determine
         else:
-            # If no explicit years of experience found, check for keywords like "junior", "senior"
-            # Added more nuanced scoring for keyword matches
-            job_desc_lower = job_description_text.lower()
-            resume_text_lower = resume_processed_text.lower()
-
-            if "senior" in job_desc_lower and "senior" in resume_text_lower:
-                experience_score = 0.9
-            elif "junior" in job_desc_lower and "junior" in resume_text_lower:
-                experience_score = 0.9
-            elif "entry-level" in job_desc_lower and "entry-level" in resume_text_lower:
-                experience_score = 0.9
-            elif "lead" in job_desc_lower and "lead" in resume_text_lower:
-                experience_score = 0.85
-            elif "manager" in job_desc_lower and "manager" in resume_text_lower:
-                experience_score = 0.8
-            else:
-                experience_score = 0.5 # Neutral if no clear match
+            # If no years of experience are known, check for keywords like "junior", "senior"
+            # that appear in both the job description and the resume
+            experience_score = 0.5 # Neutral if no clear match
+            common_mask = job_profile['seniority_mask'] & resume_seniority_mask
+            if common_mask:
+                # The lowest set bit is the first keyword in SENIORITY_KEYWORDS order
+                experience_score = _SENIORITY_BIT_SCORES[(common_mask & -common_mask).bit_length() - 1]
 
+    return experience_score
+
+
+def _combine_scores(semantic_similarity, skill_match_percentage, experience_score):
+    # Normalize semantic similarity to be between 0 and 1
+    # A common practice is to scale from [-1, 1] to [0, 1]
+    semantic_similarity = (semantic_similarity + 1) / 2
 
-    # 5. Combine Scores with Weights
     total_weight = WEIGHT_SEMANTIC + WEIGHT_SKILL_MATCH + WEIGHT_EXPERIENCE
 
     final_score = (
@@ -128,7 +308,166 @@ def calculate_match_score_enhanced(job_description_text, required_skills, experi
     final_score = (final_score / total_weight) * 100 # Normalize to 100
 
     # Ensure score is within 0-100 range
-    final_score = np.clip(final_score, 0, 100)
+    return np.clip(final_score, 0, 100)
+
+
+def parse_experience_range(experience_required):
+    """Parse "3-5" or "5+" into (min_years, max_years); None for "Any" or an empty value.
+
+    Any other value without "-" or "+" (e.g. "4" or "5 years") gives (0, inf), i.e. no bound.
+    Raises ValueError when a value with "-" or "+" has no whole numbers around it ("a-b", "5+ years").
+    """
+    if not experience_required or experience_required == "Any":
+        return None
+    job_min_exp, job_max_exp = 0, float('inf')
+    if '-' in experience_required:
+        parts = experience_required.split('-')
+        job_min_exp = int(parts[0])
+        job_max_exp = int(parts[1].replace('+', '')) if '+' in parts[1] else int(parts[1])
+    elif '+' in experience_required:
+        job_min_exp = int(experience_required.replace('+', ''))
+    return job_min_exp, job_max_exp
+
+
+def compile_job_profile(job_description_text, required_skills, experience_required, embed=True):
+    """Precompute everything the scoring loop needs from a job, once per job.
+
+    The returned dict holds the JD embedding (None if it could not be computed), the
+    lowercased required skill set, the parsed experience range and the mask of seniority
+    keywords present in the job description.
+    """
+    job_desc_lower = job_description_text.lower()
+    embedding = None
+    if embed and get_model():
+        try:
+            embedding = embed_texts([job_description_text])[0]
+        except Exception as e:
+            print(f"Could not embed job description: {e}")
+    return {
+        'job_description': job_description_text,
+        'embedding': embedding,
+        'required_skills': set([skill.lower() for skill in required_skills]),
+        'experience_range': parse_experience_range(experience_required),
+        'seniority_mask': seniority_mask(job_desc_lower)
+    }
+
+
+def score_resumes_for_job(job_profile, resumes, batch_size=DEFAULT_BATCH_SIZE, skill_matches=None,
+                          experience_profiles=None, tfidf=None, resume_embeddings=None):
+    """Score many resumes against a profile from compile_job_profile().
 
-    return final_score, matched_required_skills
+    `resumes` is a list of (processed_text, extracted_skills) pairs. Returns a list
+    of (match_score, matched_skills) tuples in the same order. If the matched required
+    skills are already known (e.g. from a SkillIndex), pass them as `skill_matches`,
+    one list per resume, and extracted_skills is not looked at. Likewise
+    `experience_profiles` gives each resume's extract_experience_profile() tuple (None
+    entries are computed from the processed text). When scoring one screening in several
+    calls, pass the same TfidfFallback as `tfidf` so a TF-IDF fallback scores them alike.
+    Already known resume embeddings (e.g. stored at upload) can be passed as
+    `resume_embeddings`, one unit-normalised row per resume, so nothing is encoded.
+    """
+    if not resumes:
+        return []
 
+    # 1. Semantic Similarity using BERT Embeddings (or TF-IDF fallback)
+    semantic_similarities = _semantic_similarities(
+        job_profile, [processed_text for processed_text, _ in resumes], batch_size, tfidf, resume_embeddings
+    )
+
+    scores = []
+    required_count = len(job_profile['required_skills'])
+    for i, (semantic_similarity, (processed_text, extracted_skills)) in enumerate(zip(semantic_similarities, resumes)):
+        # 2. Skill Matching (Rule-based)
+        if skill_matches is None:
+            skill_match_percentage, matched_required_skills = _skill_match(job_profile['required_skills'], extracted_skills)
+        else:
+            matched_required_skills = skill_matches[i]
+            skill_match_percentage = _skill_match_percentage(len(matched_required_skills), required_count)
+        # 3. Experience Matching (Rule-based)
+        experience_profile = experience_profiles[i] if experience_profiles is not None else None
+        if experience_profile is None:
+            experience_profile = extract_experience_profile(processed_text, processed_text)
+        experience_score = _experience_score(job_profile, experience_profile)
+        # 5. Combine Scores with Weights
+        final_score = _combine_scores(semantic_similarity, skill_match_percentage, experience_score)
+        scores.append((final_score, matched_required_skills))
+    return scores
+
+
+def score_matrix(job_profiles, resumes, batch_size=DEFAULT_BATCH_SIZE, experience_profiles=None, tfidf=None,
+                 resume_embeddings=None):
+    """Score every resume against every job in one vectorised pass.
+
+    `job_profiles` come from compile_job_profile(); `resumes`, `experience_profiles`, `tfidf`
+    and `resume_embeddings` are as for score_resumes_for_job(). Returns a (jobs x resumes) float array with the same match
+    scores score_resumes_for_job() gives each job.
+    """
+    job_count, resume_count = len(job_profiles), len(resumes)
+    if not job_count or not resume_count:
+        return np.zeros((job_count, resume_count))
+
+    # 1. Semantic similarity: one jobs x resumes embedding product
+    semantic_similarities = _semantic_similarity_matrix(
+        job_profiles, [processed_text for processed_text, _ in resumes], batch_size, tfidf, resume_embeddings
+    )
+
+    # 2. Skill overlap: boolean jobs x skills and resumes x skills matrices over the required
+    # skills of all jobs; their product counts every job's matched skills for every resume
+    skill_columns = {}
+    for job_profile in job_profiles:
+        for skill in job_profile['required_skills']:
+            skill_columns.setdefault(skill, len(skill_columns))
+    required = np.zeros((job_count, len(skill_columns)))
+    for row, job_profile in enumerate(job_profiles):
+        required[row, [skill_columns[skill] for skill in job_profile['required_skills']]] = 1
+    present = np.zeros((resume_count, len(skill_columns)))
+    for row, (_, extracted_skills) in enumerate(resumes):
+        columns = [skill_columns[skill] for skill in {skill.lower() for skill in extracted_skills}
+                   if skill in skill_columns]
+        present[row, columns] = 1
+    required_counts = required.sum(axis=1, keepdims=True)
+    skill_match = np.divide(required @ present.T, required_counts, out=np.zeros((job_count, resume_count)),
+                            where=required_counts > 0)
+    # Same boost / penalty as _skill_match_percentage
+    skill_match = np.where(skill_match > 0.7, skill_match * 1.1,
+                           np.where(skill_match < 0.3, skill_match * 0.8, skill_match))
+
+    # 3. Experience: _experience_score as array arithmetic over both sets of profiles
+    if experience_profiles is None:
+        experience_profiles = [None] * resume_count
+    profiles = [profile if profile is not None else extract_experience_profile(processed_text, processed_text)
+                for profile, (processed_text, _) in zip(experience_profiles, resumes)]
+    resume_min = np.array([np.nan if profile[0] is None else profile[0] for profile in profiles], dtype=float)
+    resume_max = np.array([np.nan if profile[1] is None else profile[1] for profile in profiles], dtype=float)
+    span_years = np.array([profile[2] for profile in profiles], dtype=float)
+    resume_masks = np.array([profile[3] for profile in profiles], dtype=np.int64)
+    use_span = np.isnan(resume_min) & (span_years > 0)
+    resume_min = np.where(use_span, span_years, resume_min)
+    resume_max = np.where(use_span, span_years, resume_max)
+    years_known = ~np.isnan(resume_min)
+
+    has_range = np.array([job_profile['experience_range'] is not None for job_profile in job_profiles])
+    job_min = np.array([job_profile['experience_range'][0] if job_profile['experience_range'] else 0
+                        for job_profile in job_profiles], dtype=float)[:, None]
+    job_max = np.array([job_profile['experience_range'][1] if job_profile['experience_range'] else 0
+                        for job_profile in job_profiles], dtype=float)[:, None]
+    job_masks = np.array([job_profile['seniority_mask'] for job_profile in job_profiles], dtype=np.int64)
+
+    with np.errstate(invalid='ignore'):  # NaN comparisons (no stated years) are masked out below
+        years_score = np.select(
+            [(job_min <= resume_max) & (job_max >= resume_min), resume_min > job_max, resume_max < job_min],
+            [1.0, 0.7, 0.3], 0.5
+        )
+    seniority_score = _SENIORITY_MASK_SCORES[job_masks[:, None] & resume_masks[None, :]]
+    experience = np.where(years_known[None, :], years_score, seniority_score)
+    experience = np.where(has_range[:, None], experience, 0.0)
+
+    # 4. Combine Scores with Weights
+    return _combine_scores(semantic_similarities, skill_match, experience)
+
+
+# This function will be called from app.py
+def calculate_match_score_enhanced(job_description_text, required_skills, experience_required,
+                                    resume_processed_text, resume_extracted_skills, hf_api_key=None):
+    job_profile = compile_job_profile(job_description_text, required_skills, experience_required, embed=False)
+    return score_resumes_for_job(job_profile, [(resume_processed_text, resume_extracted_skills)])[0]
@@ -0,0 +1,47 @@
+# resume_record.py
+import sys
+
+
+class ResumeRecord:
+    """Compact per-resume record used for screening.
+
+    __slots__ avoids a per-instance dict, skill and category names are interned so
+    thousands of resumes share one copy of each string, and the raw extracted text is
+    not kept here at all: it lives in its own store namespace and is only loaded when a
+    single resume is viewed.
+    """
+
+    __slots__ = ('filename', 'filepath', 'content_hash', 'processed_text', 'extracted_skills',
+                 'categorized_field', 'category_scores', 'page_offsets', 'experience_profile')
+
+    def __init__(self, filename, filepath, processed_text, extracted_skills, categorized_field,
+                 category_scores=None, page_offsets=(), content_hash=None, experience_profile=None):
+        self.filename = filename
+        self.filepath = filepath
+        self.content_hash = content_hash # SHA-256 of the uploaded bytes
+        self.processed_text = processed_text
+        self.extracted_skills = tuple(sys.intern(skill) for skill in extracted_skills)
+        self.categorized_field = sys.intern(categorized_field)
+        # Keyword hits per category, for filtering
+        self.category_scores = {sys.intern(category): hits for category, hits in (category_scores or {}).items()}
+        self.page_offsets = tuple(page_offsets) # Where each page starts in the raw text
+        # (min_years, max_years, span_years, seniority_mask) from extract_experience_profile();
+        # None for records stored before profiles existed
+        self.experience_profile = tuple(experience_profile) if experience_profile is not None else None
+
+    def to_dict(self):
+        return {
+            'filename': self.filename,
+            'filepath': self.filepath,
+            'content_hash': self.content_hash,
+            'processed_text': self.processed_text,
+            'extracted_skills': list(self.extracted_skills),
+            'categorized_field': self.categorized_field,
+            'category_scores': self.category_scores,
+            'page_offsets': list(self.page_offsets),
+            'experience_profile': list(self.experience_profile) if self.experience_profile is not None else None
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
@@ -0,0 +1,45 @@
+# skill_index.py
+import threading
+
+
+class SkillIndex:
+    """Inverted index from skill (lowercase) to the ids of the resumes that list it.
+
+    Lets screening find every resume's matched required skills with one set intersection
+    per required skill, before any resume record is loaded or embedded.
+    """
+
+    def __init__(self):
+        self._postings = {}  # skill -> set of resume ids
+        self._indexed = set()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._indexed)
+
+    def __contains__(self, resume_id):
+        return resume_id in self._indexed
+
+    def add(self, resume_id, skills):
+        with self._lock:
+            for skill in skills:
+                self._postings.setdefault(skill.lower(), set()).add(resume_id)
+            self._indexed.add(resume_id)
+
+    def matches(self, required_skills, resume_ids):
+        """Return {resume_id: [matched required skills]} for resume_ids with at least one match.
+
+        Skills are listed in the iteration order of `required_skills`.
+        """
+        candidates = set(resume_ids)
+        matched = {}
+        with self._lock:
+            for skill in required_skills:
+                for resume_id in self._postings.get(skill, set()) & candidates:
+                    matched.setdefault(resume_id, []).append(skill)
+        return matched
+
+    def clear(self):
+        with self._lock:
+            self._postings.clear()
+            self._indexed.clear()
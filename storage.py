@@ -0,0 +1,176 @@
+# storage.py
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import MutableMapping
+
+
+class MemoryNamespace(MutableMapping):
+    """A plain dict living in this process; fastest, but invisible to other workers."""
+
+    def __init__(self):
+        self._data = {}
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(list(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get_many(self, keys):
+        # Returns {key: value} for the keys that exist
+        return {key: self._data[key] for key in keys if key in self._data}
+
+    def items(self):
+        return list(self._data.items())
+
+    def values(self):
+        return list(self._data.values())
+
+    def clear(self):
+        self._data.clear()
+
+
+class SQLiteNamespace(MutableMapping):
+    """One namespace of a SQLiteStore, used like a dict of JSON-serialisable values.
+
+    Values are copies: mutating a value read from here does not change the stored one,
+    so always write a record back with `namespace[key] = record`. A `codec` class with
+    to_dict()/from_dict() lets the namespace hold objects such as ResumeRecord.
+    """
+
+    def __init__(self, store, name, codec=None):
+        self._store = store
+        self._name = name
+        self._codec = codec
+
+    def _dumps(self, value):
+        return json.dumps(value.to_dict() if self._codec else value)
+
+    def _loads(self, text):
+        value = json.loads(text)
+        return self._codec.from_dict(value) if self._codec else value
+
+    def __getitem__(self, key):
+        row = self._store._execute(
+            "SELECT value FROM kv WHERE namespace = ? AND key = ?", (self._name, key)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return self._loads(row[0])
+
+    def __setitem__(self, key, value):
+        self._store._execute(
+            "INSERT OR REPLACE INTO kv (namespace, key, value) VALUES (?, ?, ?)",
+            (self._name, key, self._dumps(value))
+        )
+
+    def __delitem__(self, key):
+        cursor = self._store._execute("DELETE FROM kv WHERE namespace = ? AND key = ?", (self._name, key))
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+
+    def __iter__(self):
+        rows = self._store._execute("SELECT key FROM kv WHERE namespace = ?", (self._name,)).fetchall()
+        return iter([row[0] for row in rows])
+
+    def __len__(self):
+        return self._store._execute("SELECT COUNT(*) FROM kv WHERE namespace = ?", (self._name,)).fetchone()[0]
+
+    def __contains__(self, key):
+        if not isinstance(key, str):
+            return False
+        return self._store._execute(
+            "SELECT 1 FROM kv WHERE namespace = ? AND key = ?", (self._name, key)
+        ).fetchone() is not None
+
+    def get_many(self, keys):
+        # Returns {key: value} for the keys that exist, fetched in as few queries as possible
+        keys = list(keys)
+        found = {}
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            rows = self._store._execute(
+                f"SELECT key, value FROM kv WHERE namespace = ? AND key IN ({','.join('?' * len(batch))})",
+                (self._name, *batch)
+            ).fetchall()
+            found.update((key, self._loads(value)) for key, value in rows)
+        return found
+
+    def items(self):
+        rows = self._store._execute("SELECT key, value FROM kv WHERE namespace = ?", (self._name,)).fetchall()
+        return [(key, self._loads(value)) for key, value in rows]
+
+    def values(self):
+        return [value for _, value in self.items()]
+
+    def clear(self):
+        self._store._execute("DELETE FROM kv WHERE namespace = ?", (self._name,))
+
+
+class MemoryStore:
+    def __init__(self):
+        self._namespaces = {}
+
+    def namespace(self, name, codec=None):
+        # Objects are kept as they are, so no codec is needed in memory
+        return self._namespaces.setdefault(name, MemoryNamespace())
+
+
+class SQLiteStore:
+    """Key-value store in one SQLite file in WAL mode, shared by every worker process.
+
+    Each thread (and each forked process) opens its own connection on first use.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._execute("""
+            CREATE TABLE IF NOT EXISTS kv (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (namespace, key)
+            ) WITHOUT ROWID
+        """)
+
+    def _connection(self):
+        # Connections must not cross a fork, so they are keyed by the owning pid too
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _execute(self, sql, params=()):
+        return self._connection().execute(sql, params)
+
+    def namespace(self, name, codec=None):
+        return SQLiteNamespace(self, name, codec)
+
+
+def create_store(backend=None, path=None):
+    """Build the store selected by STORAGE_BACKEND ("memory" or "sqlite") / STORAGE_PATH."""
+    backend = (backend or os.environ.get("STORAGE_BACKEND", "memory")).lower()
+    if backend == "memory":
+        return MemoryStore()
+    if backend == "sqlite":
+        return SQLiteStore(path or os.environ.get("STORAGE_PATH", "resume_store.sqlite3"))
+    raise ValueError(f"Unknown STORAGE_BACKEND: {backend}")
@@ -0,0 +1,160 @@
+# task_queue.py
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TaskProgress:
+    """Handed to a background task so it can publish progress and partial results."""
+
+    def __init__(self, manager, task_id):
+        self._manager = manager
+        self._task_id = task_id
+
+    def set_total(self, total):
+        self._manager._update(self._task_id, total=total)
+
+    def advance(self, processed=1, results=None):
+        self._manager._update(self._task_id, processed=processed, results=results)
+
+
+class TaskManager:
+    """Runs long requests (bulk uploads, screening) on an in-process thread pool.
+
+    Each task records its status, a processed/total counter and the partial results
+    published so far, so clients can poll for progress and pick up results as they arrive.
+    Only the newest `max_tasks` tasks are kept; older finished ones are forgotten.
+
+    If `records` (a dict-like store namespace) is given, other worker processes sharing the
+    store can report on tasks run here: every update writes the task's status and progress
+    there, and the partial results and final result are written once, when the task ends,
+    under "<task_id>/results". Shared records of finished tasks expire after
+    `record_ttl_seconds`, whichever worker ran them.
+    """
+
+    def __init__(self, max_workers=2, max_tasks=200, records=None, record_ttl_seconds=3600, sweep_interval=60):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='task')
+        self._tasks = OrderedDict()
+        self._lock = threading.Lock()
+        self._records = records
+        self.max_tasks = max_tasks
+        self.record_ttl_seconds = record_ttl_seconds
+        self.sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+
+    def submit(self, kind, function, *args, **kwargs):
+        """Queue function(*args, progress=TaskProgress, **kwargs) and return the new task id.
+
+        Whatever the function returns is stored as the task's final 'result'.
+        """
+        task_id = str(uuid.uuid4())
+        with self._lock:
+            self._tasks[task_id] = {
+                'task_id': task_id,
+                'kind': kind,
+                'status': 'queued',
+                'processed': 0,
+                'total': None,
+                'results': [],
+                'result': None,
+                'error': None,
+                'created_at': time.time(),
+                'finished_at': None
+            }
+            self._evict()
+            self._sweep_records()
+            self._publish(task_id)
+        self._executor.submit(self._run, task_id, function, args, kwargs)
+        return task_id
+
+    def get(self, task_id, since=0):
+        """Snapshot of a task with the partial results published from index `since` on."""
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None and self._records is not None:
+                task = self._shared_task(task_id)
+            if task is None:
+                return None
+            snapshot = {key: value for key, value in task.items() if key != 'results'}
+            snapshot['results'] = task['results'][since:]
+            snapshot['next_since'] = len(task['results'])
+            return snapshot
+
+    def _run(self, task_id, function, args, kwargs):
+        self._update(task_id, status='running')
+        try:
+            result = function(*args, progress=TaskProgress(self, task_id), **kwargs)
+            self._update(task_id, status='completed', result=result, finished_at=time.time())
+        except Exception as e:
+            traceback.print_exc()
+            self._update(task_id, status='failed', error=str(e), finished_at=time.time())
+
+    def _update(self, task_id, processed=0, results=None, **fields):
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return
+            task.update(fields)
+            task['processed'] += processed
+            if results:
+                task['results'].extend(results)
+            self._publish(task_id)
+
+    def _publish(self, task_id):
+        # Called with the lock held. Progress updates write only the small status record; the
+        # results are written once, when the task ends, so a task's writes stay linear in its size
+        if self._records is None:
+            return
+        task = self._tasks[task_id]
+        self._records[task_id] = {key: value for key, value in task.items() if key not in ('results', 'result')}
+        if task['status'] in ('completed', 'failed'):
+            self._records[self._results_key(task_id)] = {'results': task['results'], 'result': task['result']}
+
+    @staticmethod
+    def _results_key(task_id):
+        return f"{task_id}/results"
+
+    def _shared_task(self, task_id):
+        # Called with the lock held: a task run by another worker, as published to the store
+        task = self._records.get(task_id)
+        if task is None:
+            return None
+        if self._record_expired(task):
+            self._delete_record(task_id)
+            return None
+        task = dict(task, results=[], result=None)
+        if task['status'] in ('completed', 'failed'):
+            task.update(self._records.get(self._results_key(task_id)) or {})
+        return task
+
+    def _record_expired(self, task):
+        return task.get('finished_at') is not None and time.time() - task['finished_at'] > self.record_ttl_seconds
+
+    def _delete_record(self, task_id):
+        self._records.pop(task_id, None)
+        self._records.pop(self._results_key(task_id), None)
+
+    def _sweep_records(self):
+        # Called with the lock held, at most once per sweep_interval: drop expired shared
+        # records, including those of tasks run by other (possibly gone) workers
+        if self._records is None or time.time() - self._last_sweep < self.sweep_interval:
+            return
+        self._last_sweep = time.time()
+        for task_id in [key for key in self._records if not key.endswith('/results')]:
+            task = self._records.get(task_id)
+            if task is not None and self._record_expired(task):
+                self._delete_record(task_id)
+
+    def _evict(self):
+        # Called with the lock held; drop the oldest finished tasks beyond max_tasks
+        excess = len(self._tasks) - self.max_tasks
+        if excess <= 0:
+            return
+        for task_id in [task_id for task_id, task in self._tasks.items()
+                        if task['status'] in ('completed', 'failed')][:excess]:
+            del self._tasks[task_id]
+            if self._records is not None:
+                self._delete_record(task_id)
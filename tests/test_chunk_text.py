@@ -0,0 +1,21 @@
+import pytest
+
+from resume_matcher import chunk_text
+
+
+def test_every_word_is_covered_by_overlapping_windows():
+    words = [f"w{i}" for i in range(50)]
+    chunks = chunk_text(" ".join(words), chunk_words=10, overlap=3)
+    assert chunks[0].split() == words[:10]
+    assert chunks[1].split()[:3] == words[7:10]
+    assert {word for chunk in chunks for word in chunk.split()} == set(words)
+
+
+def test_short_text_is_one_chunk():
+    assert chunk_text("a b c", chunk_words=10, overlap=3) == ["a b c"]
+
+
+@pytest.mark.parametrize("overlap", [10, 32, -1])
+def test_overlap_must_be_smaller_than_the_window(overlap):
+    with pytest.raises(ValueError):
+        chunk_text(" ".join(["w"] * 50), chunk_words=10, overlap=overlap)
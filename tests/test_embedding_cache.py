@@ -0,0 +1,67 @@
+import multiprocessing
+
+import numpy as np
+
+from embedding_cache import EmbeddingCache
+
+
+def vector(seed, dim=8):
+    return np.random.default_rng(seed).random(dim, dtype=np.float32)
+
+
+def test_two_instances_on_one_path_do_not_share_rows(tmp_path):
+    path = str(tmp_path / "cache.bin")
+    a = EmbeddingCache(max_entries=4, path=path)
+    b = EmbeddingCache(max_entries=4, path=path)
+    a.put('key-A1', vector(1))
+    b.put('key-B', vector(2))
+    a.put('key-A2', vector(3))
+
+    assert np.array_equal(b.get('key-B'), vector(2))
+    assert np.array_equal(b.get('key-A2'), vector(3))
+    assert np.array_equal(a.get('key-B'), vector(2))
+    assert np.array_equal(a.get('key-A1'), vector(1))
+
+
+def test_restart_keeps_entries_and_never_truncates(tmp_path):
+    path = str(tmp_path / "cache.bin")
+    EmbeddingCache(max_entries=4, path=path).put('key-C', vector(4))
+    c = EmbeddingCache(max_entries=4, path=path)
+    d = EmbeddingCache(max_entries=4, path=path)
+    d.put('key-D', vector(5))
+
+    assert np.array_equal(c.get('key-C'), vector(4))
+    assert np.array_equal(c.get('key-D'), vector(5))
+
+
+def test_eviction_by_one_instance_is_seen_by_the_other(tmp_path):
+    path = str(tmp_path / "cache.bin")
+    a = EmbeddingCache(max_entries=2, path=path)
+    b = EmbeddingCache(max_entries=2, path=path)
+    a.put('k1', vector(1))
+    assert np.array_equal(b.get('k1'), vector(1))
+    b.put_many([('k2', vector(2)), ('k3', vector(3))])
+
+    assert a.get('k1') is None
+    assert np.array_equal(a.get('k3'), vector(3))
+
+
+def _put_range(path, worker):
+    cache = EmbeddingCache(max_entries=64, path=path)
+    for i in range(8):
+        cache.put(f"w{worker}-{i}", vector(worker * 100 + i))
+
+
+def test_processes_writing_concurrently(tmp_path):
+    path = str(tmp_path / "cache.bin")
+    processes = [multiprocessing.get_context('spawn').Process(target=_put_range, args=(path, worker))
+                 for worker in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    cache = EmbeddingCache(max_entries=64, path=path)
+    for worker in range(4):
+        for i in range(8):
+            assert np.array_equal(cache.get(f"w{worker}-{i}"), vector(worker * 100 + i))
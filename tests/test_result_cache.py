@@ -0,0 +1,55 @@
+import time
+
+from result_cache import ResultSetCache
+from storage import MemoryStore
+
+
+def make_cache(**kwargs):
+    store = MemoryStore()
+    return ResultSetCache(store.namespace('sets'), store.namespace('index'), **kwargs)
+
+
+def results(*scores):
+    return [{'resume_id': f"r{i}", 'filename': f"{chr(ord('z') - i)}.pdf", 'match_score': score}
+            for i, score in enumerate(scores)]
+
+
+def test_sets_are_kept_per_user_and_job():
+    cache = make_cache()
+    cache.put('u1', 'job', results(10))
+    cache.put('u2', 'job', results(20, 30))
+
+    assert cache.get('u1', 'job')['results'][0]['match_score'] == 10
+    assert len(cache.get('u2', 'job')['results']) == 2
+    assert cache.get('u3', 'job') is None
+
+
+def test_latest_only_looks_at_the_given_user():
+    cache = make_cache()
+    cache.put('u1', 'job-1', results(1))
+    cache.put('u2', 'job-2', results(2))
+    assert cache.latest('u1')['job_id'] == 'job-1'
+    assert cache.latest('u3') is None
+
+
+def test_orders_are_presorted_and_stable():
+    cache = make_cache()
+    cache.put('u1', 'job', results(50, 90, 50))
+    result_set = cache.get('u1', 'job')
+    assert ResultSetCache.order(result_set, 'score') == [1, 0, 2]
+    assert ResultSetCache.order(result_set, 'name') == [2, 1, 0]
+
+
+def test_expired_sets_are_dropped():
+    cache = make_cache(ttl_seconds=0.05)
+    cache.put('u1', 'job', results(1))
+    time.sleep(0.1)
+    assert cache.get('u1', 'job') is None
+
+
+def test_oldest_sets_are_evicted_beyond_max_results():
+    cache = make_cache(max_results=3)
+    cache.put('u1', 'old', results(1, 2))
+    cache.put('u1', 'new', results(3, 4))
+    assert cache.get('u1', 'old') is None
+    assert cache.get('u1', 'new') is not None
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+import app as app_module
+from resume_record import ResumeRecord
+
+
+@pytest.fixture
+def fresh_app():
+    # The module-level stores and index, emptied around each test
+    def clear():
+        app_module.resumes_db.clear()
+        app_module.resume_embeddings_db.clear()
+        app_module.resume_index.clear()
+    clear()
+    yield app_module
+    clear()
+
+
+def add_stored_resume(app, resume_id, vector):
+    app.resumes_db[resume_id] = ResumeRecord(filename=f"{resume_id}.pdf", filepath=f"{resume_id}.pdf",
+                                             processed_text=resume_id, extracted_skills=[],
+                                             categorized_field="Tech")
+    app.store_resume_embeddings([resume_id], [vector])
+
+
+def unit(seed):
+    vector = np.random.default_rng(seed).standard_normal(8).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def test_sync_replaces_resumes_cleared_through_another_worker(fresh_app):
+    for seed, resume_id in enumerate(['old-1', 'old-2', 'old-3']):
+        add_stored_resume(fresh_app, resume_id, unit(seed))
+    assert fresh_app.refresh_resume_index() == 0
+    assert len(fresh_app.resume_index) == 3
+
+    # Another worker clears the store (this process's index is untouched) and uploads two resumes
+    fresh_app.resumes_db.clear()
+    fresh_app.resume_embeddings_db.clear()
+    add_stored_resume(fresh_app, 'new-1', unit(10))
+    add_stored_resume(fresh_app, 'new-2', unit(11))
+
+    assert fresh_app.refresh_resume_index() == 0
+    assert sorted(fresh_app.resume_index.ids()) == ['new-1', 'new-2']
+    assert [resume_id for resume_id, _ in fresh_app.resume_index.search(unit(10), k=1)] == ['new-1']
+
+
+def test_sync_reports_resumes_without_a_current_embedding(fresh_app):
+    add_stored_resume(fresh_app, 'embedded', unit(1))
+    add_stored_resume(fresh_app, 'stale-model', unit(2))
+    fresh_app.resume_embeddings_db['stale-model'] = dict(fresh_app.resume_embeddings_db['stale-model'], model='other')
+
+    assert fresh_app.sync_resume_index() == ['stale-model']
+    assert fresh_app.resume_index.ids() == ['embedded']
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+import app as app_module
+from resume_record import ResumeRecord
+
+
+@pytest.fixture
+def screening_app(monkeypatch):
+    app_module.resume_embeddings_db.clear()
+    encoded = []
+
+    def fake_embed(texts, batch_size=None):
+        encoded.extend(texts)
+        return np.ones((len(texts), 4), dtype=np.float32) / 2
+
+    monkeypatch.setattr(app_module, 'get_model', lambda: object())
+    monkeypatch.setattr(app_module, 'embed_resume_texts', fake_embed)
+    monkeypatch.setattr(app_module, 'EMBEDDING_CHUNK_WORDS', 0)
+    yield app_module, encoded
+    app_module.resume_embeddings_db.clear()
+
+
+def record(text):
+    return ResumeRecord(filename=f"{text}.pdf", filepath=f"{text}.pdf", processed_text=text,
+                        extracted_skills=[], categorized_field="Tech")
+
+
+def test_stored_embeddings_are_used_and_missing_ones_stored(screening_app):
+    app, encoded = screening_app
+    stored_vector = np.array([1, 0, 0, 0], dtype=np.float32)
+    app.store_resume_embeddings(['stored'], [stored_vector])
+    records = {'stored': record('stored text'), 'new': record('new text')}
+
+    embeddings = app.screening_embeddings(['stored', 'new'], records)
+    assert np.array_equal(embeddings[0], stored_vector)
+    assert encoded == ['new text']
+    assert 'new' in app.resume_embeddings_db
+
+    # A second screening encodes nothing
+    app.screening_embeddings(['stored', 'new'], records)
+    assert encoded == ['new text']
+
+
+def test_embeddings_of_another_model_are_recomputed(screening_app):
+    app, encoded = screening_app
+    app.resume_embeddings_db['old'] = {'model': 'another-model', 'vector': ''}
+    app.screening_embeddings(['old'], {'old': record('old text')})
+    assert encoded == ['old text']
+
+
+def test_chunked_screening_does_not_use_stored_embeddings(screening_app, monkeypatch):
+    app, encoded = screening_app
+    monkeypatch.setattr(app, 'EMBEDDING_CHUNK_WORDS', 160)
+    assert app.screening_embeddings(['any'], {'any': record('text')}) is None
+    assert encoded == []
@@ -0,0 +1,51 @@
+import pytest
+
+from resume_record import ResumeRecord
+from storage import create_store
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def store(request, tmp_path):
+    return create_store(request.param, str(tmp_path / "store.sqlite3"))
+
+
+def test_namespace_behaves_like_a_dict(store):
+    jobs = store.namespace('jobs')
+    jobs['a'] = {'skills': ['python']}
+    jobs['b'] = {'skills': []}
+
+    assert jobs['a'] == {'skills': ['python']}
+    assert 'a' in jobs and 'z' not in jobs
+    assert sorted(jobs) == ['a', 'b'] and len(jobs) == 2
+    assert jobs.get_many(['a', 'z']) == {'a': {'skills': ['python']}}
+    assert jobs.pop('b') == {'skills': []}
+    with pytest.raises(KeyError):
+        jobs['b']
+    jobs.clear()
+    assert len(jobs) == 0
+
+
+def test_namespaces_are_separate(store):
+    store.namespace('one')['key'] = 1
+    assert 'key' not in store.namespace('two')
+
+
+def test_codec_round_trips_records(store):
+    resumes = store.namespace('resumes', codec=ResumeRecord)
+    resumes['r1'] = ResumeRecord(filename='a.pdf', filepath='x_a.pdf', processed_text='python developer',
+                                 extracted_skills=['python'], categorized_field='Tech',
+                                 category_scores={'Tech': 2}, experience_profile=(3, 5, 0, 1))
+    record = resumes.get_many(['r1'])['r1']
+    assert isinstance(record, ResumeRecord)
+    assert record.filename == 'a.pdf'
+    assert list(record.extracted_skills) == ['python']
+    assert record.category_scores == {'Tech': 2}
+    assert tuple(record.experience_profile) == (3, 5, 0, 1)
+
+
+def test_get_many_spans_query_batches(tmp_path):
+    values = create_store('sqlite', str(tmp_path / "store.sqlite3")).namespace('values')
+    for i in range(1200):
+        values[f"k{i}"] = i
+    found = values.get_many([f"k{i}" for i in range(0, 1300, 2)])
+    assert len(found) == 600 and found['k1198'] == 1198
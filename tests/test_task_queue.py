@@ -0,0 +1,78 @@
+import threading
+import time
+
+from storage import MemoryStore
+from task_queue import TaskManager
+
+
+def wait_for(manager, task_id, status, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        task = manager.get(task_id)
+        if task['status'] == status:
+            return task
+        time.sleep(0.01)
+    raise AssertionError(f"task did not reach {status}")
+
+
+def test_progress_partial_results_and_final_result():
+    release = threading.Event()
+
+    def work(progress):
+        progress.set_total(3)
+        progress.advance(2, ['a', 'b'])
+        release.wait(5)
+        progress.advance(1, ['c'])
+        return 'done'
+
+    manager = TaskManager(max_workers=1)
+    task_id = manager.submit('work', work)
+    while manager.get(task_id)['processed'] < 2:
+        time.sleep(0.01)
+    running = manager.get(task_id)
+    assert running['status'] == 'running' and running['total'] == 3
+    assert running['results'] == ['a', 'b'] and running['next_since'] == 2
+
+    release.set()
+    task = wait_for(manager, task_id, 'completed')
+    assert task['result'] == 'done'
+    assert manager.get(task_id, since=2)['results'] == ['c']
+
+
+def test_failures_are_recorded():
+    def work(progress):
+        raise RuntimeError("boom")
+
+    manager = TaskManager(max_workers=1)
+    task = wait_for(manager, manager.submit('work', work), 'failed')
+    assert task['error'] == 'boom'
+
+
+def test_other_workers_read_tasks_through_the_shared_records():
+    records = MemoryStore().namespace('tasks')
+    runner = TaskManager(max_workers=1, records=records)
+    reader = TaskManager(max_workers=1, records=records)
+
+    def work(progress):
+        progress.advance(1, ['a'])
+        return 'done'
+
+    task_id = runner.submit('work', work)
+    wait_for(runner, task_id, 'completed')
+    task = reader.get(task_id)
+    assert task['status'] == 'completed' and task['result'] == 'done' and task['results'] == ['a']
+    assert 'results' not in records[task_id]
+
+
+def test_shared_records_of_finished_tasks_expire():
+    records = MemoryStore().namespace('tasks')
+    runner = TaskManager(max_workers=1, records=records, record_ttl_seconds=0.05, sweep_interval=0)
+    task_id = runner.submit('work', lambda progress: None)
+    wait_for(runner, task_id, 'completed')
+    time.sleep(0.1)
+
+    # A later submit on any worker sweeps expired records from the store
+    TaskManager(max_workers=1, records=records, record_ttl_seconds=0.05, sweep_interval=0).submit(
+        'other', lambda progress: None)
+    assert task_id not in records
+    assert f"{task_id}/results" not in records
@@ -0,0 +1,59 @@
+import numpy as np
+
+from vector_index import VectorIndex
+
+
+def unit_rows(count, dim=16, seed=0):
+    vectors = np.random.default_rng(seed).standard_normal((count, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_exhaustive_search_below_train_threshold():
+    vectors = unit_rows(50)
+    index = VectorIndex(train_threshold=1000)
+    index.add([f"r{i}" for i in range(50)], vectors)
+
+    results = index.search(vectors[7], k=5)
+    assert results[0][0] == "r7"
+    assert len(results) == 5
+    similarities = [similarity for _, similarity in results]
+    assert similarities == sorted(similarities, reverse=True)
+
+
+def test_add_skips_known_ids():
+    vectors = unit_rows(3)
+    index = VectorIndex()
+    index.add(["a", "b"], vectors[:2])
+    index.add(["b", "c"], vectors[1:])
+    assert len(index) == 3
+    assert index.ids() == ["a", "b", "c"]
+
+
+def test_remove_compacts_and_keeps_the_rest_searchable():
+    vectors = unit_rows(40)
+    index = VectorIndex(train_threshold=1000)
+    ids = [f"r{i}" for i in range(40)]
+    index.add(ids, vectors)
+    index.remove(["r3", "r5", "unknown"])
+
+    assert len(index) == 38
+    assert "r3" not in index and "r4" in index
+    assert index.search(vectors[4], k=1)[0][0] == "r4"
+    assert "r5" not in [item_id for item_id, _ in index.search(vectors[5], k=38)]
+
+    index.remove(index.ids())
+    assert len(index) == 0
+    assert index.search(vectors[0], k=3) == []
+
+
+def test_trained_search_returns_k_results_even_beyond_the_probed_clusters():
+    rng = np.random.default_rng(1)
+    centres = unit_rows(60, dim=32, seed=2)
+    vectors = centres[rng.integers(0, 60, 6000)] + 0.05 * rng.standard_normal((6000, 32)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    index = VectorIndex(nprobe=2, train_threshold=1000)
+    index.add([f"r{i}" for i in range(6000)], vectors)
+
+    assert len(index.search(vectors[0], k=1000)) == 1000
+    assert len(index.search(vectors[0], k=10)) == 10
+    assert len(index.search(vectors[0], k=10000)) == 6000
@@ -0,0 +1,59 @@
+import io
+import os
+import zipfile
+
+from zip_stream import ArchiveCache, iter_zip
+
+
+def write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+    return str(path)
+
+
+def test_archive_round_trips_and_stores_compressed_formats(tmp_path):
+    text = write(tmp_path / "notes.txt", b"python " * 50000)
+    pdf = write(tmp_path / "resume.pdf", os.urandom(200000))
+
+    chunks = list(iter_zip([(text, "notes.txt"), (pdf, "resume.pdf")], chunk_size=4096))
+    assert len(chunks) > 2
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert archive.testzip() is None
+    assert archive.read("notes.txt") == b"python " * 50000
+    assert archive.getinfo("notes.txt").compress_type == zipfile.ZIP_DEFLATED
+    assert archive.getinfo("resume.pdf").compress_type == zipfile.ZIP_STORED
+
+
+def test_empty_archive_is_valid():
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(iter_zip([]))))
+    assert archive.namelist() == []
+
+
+def test_archive_cache_keys_on_content_and_keeps_finished_archives(tmp_path):
+    source = write(tmp_path / "a.docx", b"first")
+    cache = ArchiveCache(str(tmp_path / "archives"), max_files=1)
+    entries = [(source, "a.docx")]
+    key = cache.key(entries)
+    assert cache.get(key) is None
+
+    data = b"".join(cache.iter_and_store(key, iter_zip(entries)))
+    with open(cache.get(key), 'rb') as f:
+        assert f.read() == data
+
+    os.utime(source, ns=(0, 0))
+    assert cache.key(entries) != key
+
+
+def test_archive_cache_drops_incomplete_archives_and_evicts_old_ones(tmp_path):
+    source = write(tmp_path / "a.txt", b"data")
+    cache = ArchiveCache(str(tmp_path / "archives"), max_files=1)
+
+    stream = cache.iter_and_store("partial", iter_zip([(source, "a.txt")]))
+    next(stream)
+    stream.close()
+    assert cache.get("partial") is None
+    assert os.listdir(cache.directory) == []
+
+    for key in ("one", "two"):
+        b"".join(cache.iter_and_store(key, iter_zip([(source, "a.txt")])))
+    assert cache.get("one") is None and cache.get("two") is not None
@@ -1,35 +1,85 @@
 # text_extractor.py
+# Every extractor accepts either a path on disk or a binary file-like object
+# (e.g. an uploaded FileStorage stream or a BytesIO), so uploads can be read
+# without first being written to disk.
 import os
+from io import BytesIO
 from PyPDF2 import PdfReader
 from docx import Document
 
-def extract_text_from_pdf(pdf_path):
-    text = ""
+def _as_file_like(source):
+    if isinstance(source, (bytes, bytearray)):
+        return BytesIO(source)
+    return source
+
+def _source_name(source, filename=None):
+    if filename:
+        return filename
+    if isinstance(source, str):
+        return source
+    return getattr(source, 'filename', None) or getattr(source, 'name', None) or ''
+
+def iter_pdf_pages(pdf_source, max_pages=None):
+    # Yields the text of each page as it is extracted, so callers can stop early
     try:
-        with open(pdf_path, 'rb') as file:
-            reader = PdfReader(file)
-            for page in reader.pages:
-                text += page.extract_text() or ""
+        if isinstance(pdf_source, str):
+            with open(pdf_source, 'rb') as file:
+                yield from _iter_reader_pages(PdfReader(file), max_pages)
+        else:
+            yield from _iter_reader_pages(PdfReader(_as_file_like(pdf_source)), max_pages)
     except Exception as e:
-        print(f"Error extracting text from PDF {pdf_path}: {e}")
-    return text
+        print(f"Error extracting text from PDF {_source_name(pdf_source)}: {e}")
 
-def extract_text_from_docx(docx_path):
-    text = ""
+def _iter_reader_pages(reader, max_pages):
+    for page_number, page in enumerate(reader.pages):
+        if max_pages is not None and page_number >= max_pages:
+            break
+        yield page.extract_text() or ""
+
+def iter_docx_paragraphs(docx_source, max_pages=None):
+    # DOCX has no fixed pages, so paragraphs are the unit; max_pages is ignored
     try:
-        doc = Document(docx_path)
+        doc = Document(_as_file_like(docx_source))
         for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
+            yield paragraph.text + "\n"
     except Exception as e:
-        print(f"Error extracting text from DOCX {docx_path}: {e}")
-    return text
+        print(f"Error extracting text from DOCX {_source_name(docx_source)}: {e}")
+
+def iter_text_from_file(source, max_pages=None, max_chars=None, filename=None):
+    """Lazily yield a document's text page by page (PDF) or paragraph by paragraph (DOCX).
 
-def extract_text_from_file(filepath):
-    file_extension = os.path.splitext(filepath)[1].lower()
+    `source` is a path, raw bytes or a binary file-like object; for the latter two pass
+    `filename` (or use an object with a .filename/.name) so the format can be detected.
+    Stops after `max_pages` PDF pages or once `max_chars` characters have been yielded,
+    truncating the last piece so the budget is never exceeded.
+    """
+    file_extension = os.path.splitext(_source_name(source, filename))[1].lower()
     if file_extension == '.pdf':
-        return extract_text_from_pdf(filepath)
+        pieces = iter_pdf_pages(source, max_pages)
     elif file_extension == '.docx':
-        return extract_text_from_docx(filepath)
+        pieces = iter_docx_paragraphs(source, max_pages)
     else:
-        return "" # Or raise an error for unsupported types
+        return # Or raise an error for unsupported types
+
+    remaining_chars = max_chars
+    for piece in pieces:
+        if remaining_chars is not None:
+            if len(piece) >= remaining_chars:
+                yield piece[:remaining_chars]
+                pieces.close()
+                return
+            remaining_chars -= len(piece)
+        yield piece
+
+def extract_pages_from_file(source, max_pages=None, max_chars=None, filename=None):
+    # Same text as extract_text_from_file, but keeps the page/paragraph boundaries
+    return list(iter_text_from_file(source, max_pages, max_chars, filename))
+
+def extract_text_from_pdf(pdf_source, max_pages=None):
+    return "".join(iter_pdf_pages(pdf_source, max_pages))
+
+def extract_text_from_docx(docx_source):
+    return "".join(iter_docx_paragraphs(docx_source))
 
+def extract_text_from_file(source, max_pages=None, max_chars=None, filename=None):
+    return "".join(iter_text_from_file(source, max_pages, max_chars, filename))
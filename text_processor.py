@@ -1,259 +1,411 @@
 import os
 import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.stem import WordNetLemmatizer
+import threading
+import time
+from functools import lru_cache
 
-# Tell NLTK where to find the downloaded resources
 nltk_data_path = os.path.join(os.path.dirname(__file__), 'nltk_data')
-nltk.data.path = [nltk_data_path] + nltk.data.path  # prioritize your custom data
 
-# Load resources without downloading
-lemmatizer = WordNetLemmatizer()
-stop_words = set(stopwords.words('english'))
+# NLTK takes about a second to import, so it is loaded on the first preprocess_text() call
+# (or by warm_up()) rather than at import time
+word_tokenize = None
+lemmatizer = None
+stop_words = None
+_lemmatize = None
+_nltk_lock = threading.Lock()
 
+# Resume vocabularies repeat heavily, so lemmas are memoised (bounded by LEMMA_CACHE_SIZE words)
+LEMMA_CACHE_SIZE = int(os.environ.get("LEMMA_CACHE_SIZE", 100000))
 
+# "nltk" (default) tokenizes with NLTK's word_tokenize (Punkt + Treebank); "regex" uses the much
+# cheaper REGEX_TOKEN_RE, which keeps tokens like node.js, c++ and 3-5 but drops lone punctuation
+# and so does not give exactly the same processed text
+PREPROCESS_TOKENIZER = os.environ.get("PREPROCESS_TOKENIZER", "nltk").lower()
+if PREPROCESS_TOKENIZER not in ('nltk', 'regex'):
+    raise ValueError(f"Unknown PREPROCESS_TOKENIZER: {PREPROCESS_TOKENIZER}")
 
-def preprocess_text(text):
+# The cleanup regexes, compiled once. URLs go first; then mentions, hashtags and every character
+# other than letters, numbers, whitespace, dots, plus and dash go in one pass (same result as two)
+URL_RE = re.compile(r'http\S+|www\S+|https\S+', flags=re.MULTILINE)
+CLEANUP_RE = re.compile(r'@\w+|#\w+|[^a-zA-Z0-9\s\.\+\-]')
+REGEX_TOKEN_RE = re.compile(r'[a-z0-9]+(?:[.+\-]+[a-z0-9]+)*\+*')
+
+# Improved regex to capture various formats like "X years experience", "X+ years", "X-Y years"
+EXPERIENCE_YEARS_RE = re.compile(r'(\d+)(?:\s*-\s*(\d+))?\+?\s*(?:year|yr)s?(?:\s*of)?\s*experience')
+
+# Employment date spans such as "2018 - 2023", "2018 – Present" or "Jan 2018 to Mar 2020". Matched on
+# the raw text, since preprocessing strips en/em dashes.
+DATE_SPAN_RE = re.compile(
+    r'(?<!\d)((?:19|20)\d{2})\s*(?:-|–|—|to|until)\s*(?:[a-z]{3,9}\.?\s+)?((?:19|20)\d{2}|present|current|now|today)(?!\d)',
+    flags=re.IGNORECASE
+)
+
+# Seniority words, in the order they are checked, with the experience score given when both the
+# job and a resume without stated years mention one. Bit i of a seniority mask is SENIORITY_KEYWORDS[i].
+SENIORITY_KEYWORD_SCORES = {
+    "senior": 0.9,
+    "junior": 0.9,
+    "entry-level": 0.9,
+    "lead": 0.85,
+    "manager": 0.8,
+}
+SENIORITY_KEYWORDS = tuple(SENIORITY_KEYWORD_SCORES)
+
+
+def _load_nltk():
+    global word_tokenize, lemmatizer, stop_words, _lemmatize
+    with _nltk_lock:
+        if stop_words is not None:
+            return
+        import nltk
+        from nltk.corpus import stopwords
+        from nltk.tokenize import word_tokenize as nltk_word_tokenize
+        from nltk.stem import WordNetLemmatizer
+
+        # Tell NLTK where to find the downloaded resources
+        if nltk_data_path not in nltk.data.path:
+            nltk.data.path = [nltk_data_path] + nltk.data.path  # prioritize your custom data
+
+        # Load resources without downloading
+        word_tokenize = nltk_word_tokenize
+        lemmatizer = WordNetLemmatizer()
+        _lemmatize = lru_cache(maxsize=LEMMA_CACHE_SIZE)(lemmatizer.lemmatize)
+        stop_words = set(stopwords.words('english'))
+
+
+def warm_up():
+    # Loads NLTK and its corpora (WordNet loads lazily on the first lemmatize) up front.
+    # Returns the seconds taken.
+    started = time.perf_counter()
+    preprocess_text("warming up the tokenizer and lemmatizer")
+    return time.perf_counter() - started
+
+
+def preprocess_text(text, tokenizer=None):
+    # tokenizer: "nltk" or "regex"; defaults to PREPROCESS_TOKENIZER
+    if stop_words is None:
+        _load_nltk()
     # Remove URLs
-    text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-    # Remove mentions and hashtags
-    text = re.sub(r'@\w+|#\w+', '', text)
-    # Keep letters, numbers, dots, plus and dash
-    text = re.sub(r'[^a-zA-Z0-9\s\.\+\-]', '', text)
+    text = URL_RE.sub('', text)
+    # Remove mentions and hashtags; keep letters, numbers, dots, plus and dash
+    text = CLEANUP_RE.sub('', text)
     # Convert to lowercase
     text = text.lower()
     # Tokenize
-    tokens = word_tokenize(text)
+    if (tokenizer or PREPROCESS_TOKENIZER) == 'regex':
+        tokens = REGEX_TOKEN_RE.findall(text)
+    else:
+        tokens = word_tokenize(text)
     # Remove stop words and lemmatize
-    processed_tokens = [lemmatizer.lemmatize(word) for word in tokens if word not in stop_words]
+    lemmatize = _lemmatize
+    processed_tokens = [lemmatize(word) for word in tokens if word not in stop_words]
     return " ".join(processed_tokens)
 
 
+# Expanded and refined common skills list
+# This is a very basic rule-based skill extraction.
+# For a real application, you'd use a pre-trained NER model (e.g., SpaCy's 'en_core_web_lg' or a custom one)
+# or a comprehensive skill dictionary.
+COMMON_SKILLS = [
+    "python", "java", "javascript", "react", "node.js", "sql", "aws", "docker",
+    "kubernetes", "machine learning", "data analysis", "project management",
+    "agile", "scrum", "communication", "leadership", "figma", "photoshop",
+    "seo", "marketing", "finance", "hr", "sales", "engineering", "design",
+    "cloud", "devops", "backend", "backend", "fullstack", "ui/ux", "data science",
+    "artificial intelligence", "cybersecurity", "network", "database", "mobile development",
+    "android", "ios", "web development", "content creation", "social media",
+    "public relations", "brand management", "market research", "financial analysis",
+    "accounting", "auditing", "investment", "recruitment", "employee relations",
+    "training", "supply chain", "logistics", "operations management", "product management",
+    "business development", "customer service", "technical support", "graphic design",
+    "illustration", "video editing", "animation", "autocad", "solidworks",
+    "excel", "powerpoint", "word", "microsoft office", "google suite", "tableau", "power bi",
+    "sas", "r", "c++", "c#", "go", "ruby", "php", "swift", "kotlin", "typescript",
+    "spring", "hibernate", "angular", "vue.js", "django", "flask", "laravel", "symfony",
+    "express.js", "mongodb", "postgresql", "mysql", "oracle", "redis", "cassandra",
+    "azure", "gcp", "terraform", "ansible", "jenkins", "gitlab ci", "jira", "confluence",
+    "salesforce", "sap", "erp", "crm", "qa", "testing", "automation", "manual testing",
+    "api", "rest", "graphql", "microservices", "blockchain", "iot", "robotics",
+    "natural language processing", "computer vision", "deep learning", "neural networks",
+    "statistical analysis", "quantitative analysis", "risk management", "compliance",
+    "budgeting", "forecasting", "financial reporting", "tax preparation", "auditing",
+    "talent acquisition", "employee engagement", "performance management", "compensation & benefits",
+    "organizational development", "change management", "negotiation", "client management",
+    "lead generation", "cold calling", "sales strategy", "customer relationship management",
+    "autocad", "solidworks", "catia", "revit", "bim", "fea", "cfd", "matlab", "simulink",
+    "circuit design", "embedded systems", "firmware", "hardware", "manufacturing processes",
+    "supply chain optimization", "inventory management", "logistics planning",
+    "user research", "wireframing", "prototyping", "usability testing", "information architecture",
+    "interaction design", "visual design", "brand identity", "print design", "digital art",
+    "video production", "motion graphics", "3d modeling", "maya", "blender", "cinema 4d",
+    "content strategy", "copywriting", "editing", "proofreading", "storytelling",
+    "email marketing", "ppc", "google analytics", "social media marketing", "influencer marketing",
+    "public speaking", "presentation skills", "problem-solving", "critical thinking",
+    "adaptability", "teamwork", "collaboration", "creativity", "innovation", "attention to detail"
+]
+
+
+_WORD_START_RE = re.compile(r'\b\w')
+# Every character that \s matches, used to expand the "node.js" / "node js" variants
+_WHITESPACE_CHARS = [chr(code) for code in range(0x3001) if chr(code).isspace()]
+_MATCH_END = None  # Trie key marking the end of a keyword
+
+
+def _is_word_char(ch):
+    # Same definition of a word character as \w in re
+    return ch.isalnum() or ch == '_'
+
+
+class _KeywordMatcher:
+    """Finds many keywords in a text in a single pass.
+
+    Equivalent to running re.search(r'\b' + re.escape(keyword) + r'\b', text) for every
+    keyword, but built once: the keywords are merged into a character trie, and since every
+    keyword starts with a word character a match can only begin at the start of a word,
+    so the text is walked from each word start instead of being rescanned per keyword.
+    """
+
+    def __init__(self, keywords):
+        # keywords: iterable of (keyword_text, value); value is reported for each match
+        self._trie = {}
+        for keyword, value in keywords:
+            if not keyword or not _is_word_char(keyword[0]):
+                raise ValueError(f"Keyword must start with a word character: {keyword!r}")
+            node = self._trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node.setdefault(_MATCH_END, []).append(value)
+
+    def iter_matches(self, text):
+        # Yields the value of every keyword occurrence bounded by \b on both sides
+        text_length = len(text)
+        for word_start in _WORD_START_RE.finditer(text):
+            node = self._trie
+            position = word_start.start()
+            while position < text_length:
+                node = node.get(text[position])
+                if node is None:
+                    break
+                position += 1
+                values = node.get(_MATCH_END)
+                if values is not None:
+                    next_is_word = position < text_length and _is_word_char(text[position])
+                    if _is_word_char(text[position - 1]) != next_is_word:
+                        yield from values
+
+
+def _skill_variants(skill):
+    # "node.js" also matches "node js" and "nodejs", like the old r'[\.\s]?' replacement
+    parts = skill.split('.')
+    variants = [parts[0]]
+    for part in parts[1:]:
+        variants = [variant + separator + part
+                    for variant in variants
+                    for separator in ['.', ''] + _WHITESPACE_CHARS]
+    return variants
+
+
+_SKILL_MATCHER = _KeywordMatcher(
+    (variant, skill.replace('.', ''))  # Clean up for display
+    for skill in COMMON_SKILLS
+    for variant in _skill_variants(skill)
+)
+
+
 def extract_skills_from_text(text):
-    # This is a very basic rule-based skill extraction.
-    # For a real application, you'd use a pre-trained NER model (e.g., SpaCy's 'en_core_web_lg' or a custom one)
-    # or a comprehensive skill dictionary.
-
-    # Expanded and refined common skills list
-    common_skills = [
-        "python", "java", "javascript", "react", "node.js", "sql", "aws", "docker",
-        "kubernetes", "machine learning", "data analysis", "project management",
-        "agile", "scrum", "communication", "leadership", "figma", "photoshop",
-        "seo", "marketing", "finance", "hr", "sales", "engineering", "design",
-        "cloud", "devops", "backend", "backend", "fullstack", "ui/ux", "data science",
-        "artificial intelligence", "cybersecurity", "network", "database", "mobile development",
-        "android", "ios", "web development", "content creation", "social media",
-        "public relations", "brand management", "market research", "financial analysis",
-        "accounting", "auditing", "investment", "recruitment", "employee relations",
-        "training", "supply chain", "logistics", "operations management", "product management",
-        "business development", "customer service", "technical support", "graphic design",
-        "illustration", "video editing", "animation", "autocad", "solidworks",
-        "excel", "powerpoint", "word", "microsoft office", "google suite", "tableau", "power bi",
-        "sas", "r", "c++", "c#", "go", "ruby", "php", "swift", "kotlin", "typescript",
-        "spring", "hibernate", "angular", "vue.js", "django", "flask", "laravel", "symfony",
-        "express.js", "mongodb", "postgresql", "mysql", "oracle", "redis", "cassandra",
-        "azure", "gcp", "terraform", "ansible", "jenkins", "gitlab ci", "jira", "confluence",
-        "salesforce", "sap", "erp", "crm", "qa", "testing", "automation", "manual testing",
-        "api", "rest", "graphql", "microservices", "blockchain", "iot", "robotics",
-        "natural language processing", "computer vision", "deep learning", "neural networks",
-        "statistical analysis", "quantitative analysis", "risk management", "compliance",
-        "budgeting", "forecasting", "financial reporting", "tax preparation", "auditing",
-        "talent acquisition", "employee engagement", "performance management", "compensation & benefits",
-        "organizational development", "change management", "negotiation", "client management",
-        "lead generation", "cold calling", "sales strategy", "customer relationship management",
-        "autocad", "solidworks", "catia", "revit", "bim", "fea", "cfd", "matlab", "simulink",
-        "circuit design", "embedded systems", "firmware", "hardware", "manufacturing processes",
-        "supply chain optimization", "inventory management", "logistics planning",
-        "user research", "wireframing", "prototyping", "usability testing", "information architecture",
-        "interaction design", "visual design", "brand identity", "print design", "digital art",
-        "video production", "motion graphics", "3d modeling", "maya", "blender", "cinema 4d",
-        "content strategy", "copywriting", "editing", "proofreading", "storytelling",
-        "email marketing", "ppc", "google analytics", "social media marketing", "influencer marketing",
-        "public speaking", "presentation skills", "problem-solving", "critical thinking",
-        "adaptability", "teamwork", "collaboration", "creativity", "innovation", "attention to detail"
-    ]
-
-    found_skills = []
     processed_text = text.lower()  # Ensure text is lowercased for matching
+    return list(set(_SKILL_MATCHER.iter_matches(processed_text)))  # Return unique skills
 
-    for skill in common_skills:
-        # Use word boundaries to avoid partial matches (e.g., 'hr' matching 'shred')
-        # Added more robust regex for common variations (e.g., "node js", "node.js")
-        if re.search(r'\b' + re.escape(skill).replace('\.', '[\.\s]?') + r'\b', processed_text):
-            found_skills.append(skill.replace('.', ''))  # Clean up for display
 
-    return list(set(found_skills))  # Return unique skills
+# Keywords that place a resume in each category. Categories are listed in priority order:
+# when two categories score the same, the one listed first wins.
+RESUME_CATEGORIES = {
+    "Tech": ["agile", "algorithm", "android", "angular", "ansible", "api", "api gateway", "arduino",
+             "asp.net", "aws", "azure", "backend", "bash", "big data", "bi tools", "blockchain",
+             "bootstrap", "capacitor", "cassandra", "c", "c++", "c#", "chatbot development", "chakra ui",
+             "cloud", "cloud engineer", "cloud-native", "cloudformation", "coding", "computer vision",
+             "confluence", "cypress", "cybersecurity", "data analyst", "data engineering", "data lakes",
+             "data modeling", "data pipelines", "data preprocessing", "data science", "data warehouse",
+             "data warehousing", "data wrangling", "datadog", "database", "deep learning", "desktop apps",
+             "design patterns", "developer", "development", "devops", "devsecops", "django", "docker",
+             "edge computing", "elastic beanstalk", "end-to-end testing", "encryption", "etl", "event-driven",
+             "express", "fastapi", "feature engineering", "firebase", "flask", "flutter", "frontend",
+             "frontend development", "frontend engineer", "full-stack engineer", "fullstack", "game development",
+             "gan", "git", "github", "gitlab", "glcp", "go", "grafana", "graphql", "grpc", "hadoop", "helm",
+             "heroku", "hive", "huggingface", "https", "iam", "identity access management", "image processing",
+             "infosec", "integration testing", "ios", "iot", "java", "javascript", "jenkins", "jira", "junit",
+             "kanban", "kafka", "keras", "kotlin", "lambda", "laravel", "linux", "load testing", "lstm",
+             "machine learning", "material ui", "matlab", "message queues", "metaverse", "microservices",
+             "mobile apps", "mobile development", "model deployment", "mongodb", "monolith", "mysql",
+             "natural language processing", "network", "network engineer", "neural networks", "next.js",
+             "nlp", "node.js", "nosql", "numpy", "oauth", "observability", "ocr", "openapi", "oracle",
+             "pandas", "pair programming", "penetration testing", "perl", "performance testing", "php",
+             "pig", "playwright", "postgresql", "power bi", "postgres", "programmer", "programming",
+             "progressive web apps", "prometheus", "pub-sub", "pytest", "pwa", "python", "qa engineer",
+             "r", "rails", "raspberry pi", "react", "react native", "redshift", "rest", "rest api", "r&d",
+             "robotics", "ruby", "rust", "scala", "scrum", "scikit-learn", "selenium", "serverless",
+             "site reliability", "site reliability engineer", "smart contracts", "snowflake", "soapui",
+             "soc analyst", "software", "software architecture", "software engineer", "solidity", "spark",
+             "spring boot", "sql", "sqlite", "ssl", "sre", "svelte", "swift", "swiftui", "tableau",
+             "tailwind", "terraform", "test automation", "testing", "time series", "tls", "trunk-based development",
+             "transformers", "typescript", "unit testing", "vercel", "version control", "vulnerability assessment",
+             "vue.js", "web3", "web app development", "web development", "windows server", "xamarin",
+             "zero trust"],
+    "Marketing": ["advertisement", "advertising", "affiliate marketing", "analytics", "b2b marketing",
+                  "b2c marketing", "brand", "brand awareness", "brand management", "campaign",
+                  "click-through rate", "competitive analysis", "content", "content creation",
+                  "content marketing", "content strategy", "conversion optimization", "copywriting",
+                  "crm", "customer acquisition", "customer engagement", "customer journey",
+                  "customer retention", "data-driven marketing", "demand generation", "digital advertising",
+                  "digital marketing", "display advertising", "drip campaigns", "email campaigns",
+                  "email marketing", "event marketing", "facebook ads", "go-to-market strategy",
+                  "google ads", "google analytics", "growth hacking", "inbound marketing",
+                  "influencer marketing", "instagram marketing", "keyword research", "landing pages",
+                  "lead generation", "lead nurturing", "linkedin ads", "loyalty marketing",
+                  "market analysis", "market research", "marketing", "marketing automation",
+                  "marketing funnel", "marketing operations", "marketing strategy", "media buying",
+                  "media planning", "mobile marketing", "omnichannel marketing", "performance marketing",
+                  "persona development", "ppc", "pr", "product marketing", "programmatic advertising",
+                  "public relations", "retargeting", "roi", "sales enablement", "search engine marketing",
+                  "search engine optimization", "sem", "seo", "social listening", "social media",
+                  "social media management", "social media marketing", "sponsorship marketing",
+                  "storytelling", "strategy", "tiktok marketing", "twitter ads", "user acquisition",
+                  "video marketing", "viral marketing", "web analytics", "webinars", "youtube ads"],
+    "Design": ["3d animation", "3d design", "3d modeling", "adobe after effects", "adobe creative cloud",
+               "adobe illustrator", "adobe indesign", "adobe photoshop", "adobe xd", "animation",
+               "architectural design", "augmented reality design", "blender", "branding", "canva",
+               "character design", "color theory", "concept art", "creative", "css", "design", "design systems",
+               "digital art", "fashion design", "figma", "game design", "graphic", "graphic design",
+               "illustration", "illustrator", "industrial design", "information architecture",
+               "interaction design", "interior design", "logo design", "material design", "mockups",
+               "motion design", "motion graphics", "photoshop", "portfolio", "presentation design",
+               "print design", "product design", "prototyping", "responsive design", "sketch",
+               "storyboarding", "style guide", "typography", "ui designer", "ui/ux", "user experience",
+               "user flows", "user interface", "ux design", "ux designer", "vector graphics", "visual",
+               "visual communication", "visual design", "vr design", "web design", "webflow", "wireframing"],
+    "Finance": ["accounting", "accounts payable", "accounts receivable", "aml", "asset allocation",
+                "asset management", "audit", "auditor", "bank reconciliation", "banking",
+                "bookkeeping", "budget", "business analysis", "capital budgeting", "capital markets",
+                "cash flow", "cfa", "cma", "compliance", "corporate finance", "cost accounting",
+                "cpa", "credit analysis", "credit risk", "derivatives", "due diligence", "econometrics",
+                "economics", "equity research", "esg finance", "external audit", "faas", "finance",
+                "financial accounting", "financial analysis", "financial auditor", "financial forecasting",
+                "financial modeling", "financial planning", "financial reporting", "fintech",
+                "fixed income", "forensic accounting", "forecasting", "fund accounting", "fund management",
+                "gaap", "hedge funds", "ifr", "ifrs", "income statement", "internal audit",
+                "investment", "investment banking", "invoice processing", "kpi analysis", "mergers and acquisitions",
+                "msa", "mutual funds", "payroll", "portfolio", "portfolio management", "private equity",
+                "profit and loss", "quantitative finance", "reconciliation", "regulatory compliance",
+                "return on investment", "revenue recognition", "risk assessment", "risk management",
+                "sap fico", "securities", "statutory audit", "tax", "tax planning", "treasury",
+                "variance analysis", "wealth management", "working capital"],
+    "HR": ["applicant tracking system", "ats", "benefits", "career development", "change management",
+           "compensation", "compliance training", "conflict resolution", "diversity and inclusion",
+           "employee benefits", "employee engagement", "employee handbook", "employee lifecycle",
+           "employee onboarding", "employee relations", "employer branding", "exit interviews",
+           "grievance handling", "hr", "hr analytics", "hr audit", "hr business partner", "hr compliance",
+           "hr generalist", "hr metrics", "hr operations", "hr policies", "hr strategy", "hr technology",
+           "hrbp", "hris", "hrms", "human capital management", "human resources", "internal mobility",
+           "job analysis", "job design", "job evaluation", "kpis", "labor law", "learning and development",
+           "lms", "manager training", "onboarding", "organizational culture", "organizational development",
+           "payroll", "performance appraisal", "performance management", "personnel management",
+           "policy development", "recruiting", "recruitment", "remote onboarding", "retention strategy",
+           "reward management", "succession planning", "talent acquisition", "talent development",
+           "talent management", "termination process", "training", "training and development",
+           "workforce", "workforce analytics", "workforce planning"],
+    "Sales": ["account executive", "account management", "b2b sales", "b2c sales", "business development",
+              "channel sales", "client engagement", "client relations", "cold calling", "commission",
+              "consultative selling", "crm", "customer acquisition", "customer retention", "deal closing",
+              "direct sales", "enterprise sales", "field sales", "inside sales", "key account management",
+              "lead generation", "negotiation", "outside sales", "pipeline management", "product demo",
+              "quota", "relationship building", "revenue", "sales", "sales analysis", "sales enablement",
+              "sales forecasting", "sales funnel", "sales management", "sales operations", "sales planning",
+              "sales process", "sales strategy", "salesforce", "solution selling", "territory management",
+              "upselling", "value proposition"],
+    "Engineering": ["aerospace", "automation", "biomedical engineering", "cad", "circuit design", "civil",
+                    "chemical", "design", "electrical", "embedded systems", "engineer", "engineering analysis",
+                    "engineering design", "engineering drawing", "engineering management", "firmware",
+                    "hardware design", "hvac", "industrial engineering", "instrumentation", "maintenance engineering",
+                    "manufacturing", "materials science", "matlab", "mechanical", "mechatronics", "plant engineering",
+                    "process engineering", "product development", "product engineering", "project engineering",
+                    "quality engineering", "r&d", "research and development", "robotics", "simulation",
+                    "solidworks", "structural", "sustainable engineering", "systems"],
+    "Social Media": ["analytics dashboard", "audience engagement", "buffer", "community engagement",
+                     "community management", "content calendar", "content creation", "engagement",
+                     "facebook", "hashtag strategy", "hootsuite", "influencer", "instagram",
+                     "linkedin", "online community", "platform management", "reels", "schedule posts",
+                     "social listening", "social media", "social media analytics", "social media management",
+                     "social media marketing", "social media optimization", "social media platforms",
+                     "social media scheduling", "social media strategy", "tiktok", "trending content", "twitter",
+                     "user engagement", "youtube"],
+    "Operations": ["6 sigma", "business continuity", "business operations", "capacity planning", "continuous improvement",
+                   "distribution", "enterprise resource planning", "erp", "inventory control", "inventory management",
+                   "kaizen", "lean manufacturing", "logistics", "materials management", "operations", "operational efficiency",
+                   "operational excellence", "order fulfillment", "pmo", "process engineering", "process improvement",
+                   "production planning", "project management office", "procurement", "quality assurance",
+                   "quality control", "resource planning", "supply chain", "supply chain management", "vendor management",
+                   "warehouse management"],
+    "Healthcare": ["biotechnology", "clinical", "clinical research", "dentist", "doctor", "epidemiology", "health administration",
+                   "health information management", "health policy", "healthcare", "healthcare analytics", "hospital",
+                   "medical", "medical billing", "medical records", "mental health", "nurse", "occupational therapy",
+                   "patient care", "pharmacist", "pharmaceutical", "physical therapy", "physician", "public health",
+                   "radiology", "research", "telemedicine", "therapist"],
+    "Education": ["academic administration", "academic advising", "blended learning", "classroom management",
+                  "curriculum development", "distance education", "e-learning", "education", "educational leadership",
+                  "educational psychology", "educational technology", "higher education", "instructor", "k-12",
+                  "learning assessment", "lesson planning", "lms", "online teaching", "pedagogy", "professor",
+                  "remote instruction", "school administration", "special education", "student affairs",
+                  "student engagement", "syllabus design", "teacher", "teaching certification", "teaching methods",
+                  "training development", "tutoring"],
+    "Customer Service": ["call center", "client experience", "client success", "client support", "contact center", "crm tools",
+                         "customer care", "customer communication", "customer engagement", "customer experience",
+                         "customer feedback", "customer interaction", "customer relations", "customer satisfaction",
+                         "customer service", "customer support", "escalation handling", "help desk", "live chat support",
+                         "phone support", "problem resolution", "service desk", "support specialist", "technical support",
+                         "ticketing system", "troubleshooting", "user support"],
+    "Legal": ["affidavit", "attorney", "civil law", "compliance", "contract law", "corporate law", "court filings",
+              "criminal law", "discovery", "dispute resolution", "esq", "ethics compliance", "family law", "intellectual property",
+              "juris", "law", "law firm", "legal", "legal advisory", "legal assistant", "legal compliance",
+              "legal counsel", "legal documentation", "legal research", "legal writing", "litigation", "paralegal",
+              "real estate law", "regulatory affairs", "risk and compliance", "trial preparation"],
+    "Project Management": ["agile coach", "asana", "backlog grooming", "baseline management", "budget forecasting",
+                           "budget management", "change management", "confluence", "cost control", "gantt charts",
+                           "jira", "kanban", "milestone tracking", "portfolio management", "program management",
+                           "project lifecycle", "project management", "project planning", "pmp", "product lifecycle",
+                           "product owner", "progress tracking", "project coordination", "project delivery",
+                           "project execution", "resource allocation", "risk analysis", "risk management", "roadmap planning",
+                           "scrum", "scrum master", "stakeholder communication", "stakeholder management", "status reporting",
+                           "trello", "waterfall model", "work breakdown structure"]
+}
 
+_CATEGORY_MATCHER = _KeywordMatcher(
+    (keyword, category)
+    for category, keywords_list in RESUME_CATEGORIES.items()
+    for keyword in keywords_list
+)
 
-def categorize_resume(text):
+
+def score_resume_categories(text):
+    """Count category keyword hits in one pass over the text.
+
+    Returns (category, category_scores): the category with the most hits (or "Other" /
+    "Uncategorized" when nothing matches) and a dict of hit counts for every category
+    with at least one hit.
+    """
     text = text.lower()
 
-    categories = {
-        "Tech": ["agile", "algorithm", "android", "angular", "ansible", "api", "api gateway", "arduino",
-                 "asp.net", "aws", "azure", "backend", "bash", "big data", "bi tools", "blockchain",
-                 "bootstrap", "capacitor", "cassandra", "c", "c++", "c#", "chatbot development", "chakra ui",
-                 "cloud", "cloud engineer", "cloud-native", "cloudformation", "coding", "computer vision",
-                 "confluence", "cypress", "cybersecurity", "data analyst", "data engineering", "data lakes",
-                 "data modeling", "data pipelines", "data preprocessing", "data science", "data warehouse",
-                 "data warehousing", "data wrangling", "datadog", "database", "deep learning", "desktop apps",
-                 "design patterns", "developer", "development", "devops", "devsecops", "django", "docker",
-                 "edge computing", "elastic beanstalk", "end-to-end testing", "encryption", "etl", "event-driven",
-                 "express", "fastapi", "feature engineering", "firebase", "flask", "flutter", "frontend",
-                 "frontend development", "frontend engineer", "full-stack engineer", "fullstack", "game development",
-                 "gan", "git", "github", "gitlab", "glcp", "go", "grafana", "graphql", "grpc", "hadoop", "helm",
-                 "heroku", "hive", "huggingface", "https", "iam", "identity access management", "image processing",
-                 "infosec", "integration testing", "ios", "iot", "java", "javascript", "jenkins", "jira", "junit",
-                 "kanban", "kafka", "keras", "kotlin", "lambda", "laravel", "linux", "load testing", "lstm",
-                 "machine learning", "material ui", "matlab", "message queues", "metaverse", "microservices",
-                 "mobile apps", "mobile development", "model deployment", "mongodb", "monolith", "mysql",
-                 "natural language processing", "network", "network engineer", "neural networks", "next.js",
-                 "nlp", "node.js", "nosql", "numpy", "oauth", "observability", "ocr", "openapi", "oracle",
-                 "pandas", "pair programming", "penetration testing", "perl", "performance testing", "php",
-                 "pig", "playwright", "postgresql", "power bi", "postgres", "programmer", "programming",
-                 "progressive web apps", "prometheus", "pub-sub", "pytest", "pwa", "python", "qa engineer",
-                 "r", "rails", "raspberry pi", "react", "react native", "redshift", "rest", "rest api", "r&d",
-                 "robotics", "ruby", "rust", "scala", "scrum", "scikit-learn", "selenium", "serverless",
-                 "site reliability", "site reliability engineer", "smart contracts", "snowflake", "soapui",
-                 "soc analyst", "software", "software architecture", "software engineer", "solidity", "spark",
-                 "spring boot", "sql", "sqlite", "ssl", "sre", "svelte", "swift", "swiftui", "tableau",
-                 "tailwind", "terraform", "test automation", "testing", "time series", "tls", "trunk-based development",
-                 "transformers", "typescript", "unit testing", "vercel", "version control", "vulnerability assessment",
-                 "vue.js", "web3", "web app development", "web development", "windows server", "xamarin",
-                 "zero trust"],
-        "Marketing": ["advertisement", "advertising", "affiliate marketing", "analytics", "b2b marketing",
-                      "b2c marketing", "brand", "brand awareness", "brand management", "campaign",
-                      "click-through rate", "competitive analysis", "content", "content creation",
-                      "content marketing", "content strategy", "conversion optimization", "copywriting",
-                      "crm", "customer acquisition", "customer engagement", "customer journey",
-                      "customer retention", "data-driven marketing", "demand generation", "digital advertising",
-                      "digital marketing", "display advertising", "drip campaigns", "email campaigns",
-                      "email marketing", "event marketing", "facebook ads", "go-to-market strategy",
-                      "google ads", "google analytics", "growth hacking", "inbound marketing",
-                      "influencer marketing", "instagram marketing", "keyword research", "landing pages",
-                      "lead generation", "lead nurturing", "linkedin ads", "loyalty marketing",
-                      "market analysis", "market research", "marketing", "marketing automation",
-                      "marketing funnel", "marketing operations", "marketing strategy", "media buying",
-                      "media planning", "mobile marketing", "omnichannel marketing", "performance marketing",
-                      "persona development", "ppc", "pr", "product marketing", "programmatic advertising",
-                      "public relations", "retargeting", "roi", "sales enablement", "search engine marketing",
-                      "search engine optimization", "sem", "seo", "social listening", "social media",
-                      "social media management", "social media marketing", "sponsorship marketing",
-                      "storytelling", "strategy", "tiktok marketing", "twitter ads", "user acquisition",
-                      "video marketing", "viral marketing", "web analytics", "webinars", "youtube ads"],
-        "Design": ["3d animation", "3d design", "3d modeling", "adobe after effects", "adobe creative cloud",
-                   "adobe illustrator", "adobe indesign", "adobe photoshop", "adobe xd", "animation",
-                   "architectural design", "augmented reality design", "blender", "branding", "canva",
-                   "character design", "color theory", "concept art", "creative", "css", "design", "design systems",
-                   "digital art", "fashion design", "figma", "game design", "graphic", "graphic design",
-                   "illustration", "illustrator", "industrial design", "information architecture",
-                   "interaction design", "interior design", "logo design", "material design", "mockups",
-                   "motion design", "motion graphics", "photoshop", "portfolio", "presentation design",
-                   "print design", "product design", "prototyping", "responsive design", "sketch",
-                   "storyboarding", "style guide", "typography", "ui designer", "ui/ux", "user experience",
-                   "user flows", "user interface", "ux design", "ux designer", "vector graphics", "visual",
-                   "visual communication", "visual design", "vr design", "web design", "webflow", "wireframing"],
-        "Finance": ["accounting", "accounts payable", "accounts receivable", "aml", "asset allocation",
-                    "asset management", "audit", "auditor", "bank reconciliation", "banking",
-                    "bookkeeping", "budget", "business analysis", "capital budgeting", "capital markets",
-                    "cash flow", "cfa", "cma", "compliance", "corporate finance", "cost accounting",
-                    "cpa", "credit analysis", "credit risk", "derivatives", "due diligence", "econometrics",
-                    "economics", "equity research", "esg finance", "external audit", "faas", "finance",
-                    "financial accounting", "financial analysis", "financial auditor", "financial forecasting",
-                    "financial modeling", "financial planning", "financial reporting", "fintech",
-                    "fixed income", "forensic accounting", "forecasting", "fund accounting", "fund management",
-                    "gaap", "hedge funds", "ifr", "ifrs", "income statement", "internal audit",
-                    "investment", "investment banking", "invoice processing", "kpi analysis", "mergers and acquisitions",
-                    "msa", "mutual funds", "payroll", "portfolio", "portfolio management", "private equity",
-                    "profit and loss", "quantitative finance", "reconciliation", "regulatory compliance",
-                    "return on investment", "revenue recognition", "risk assessment", "risk management",
-                    "sap fico", "securities", "statutory audit", "tax", "tax planning", "treasury",
-                    "variance analysis", "wealth management", "working capital"],
-        "HR": ["applicant tracking system", "ats", "benefits", "career development", "change management",
-               "compensation", "compliance training", "conflict resolution", "diversity and inclusion",
-               "employee benefits", "employee engagement", "employee handbook", "employee lifecycle",
-               "employee onboarding", "employee relations", "employer branding", "exit interviews",
-               "grievance handling", "hr", "hr analytics", "hr audit", "hr business partner", "hr compliance",
-               "hr generalist", "hr metrics", "hr operations", "hr policies", "hr strategy", "hr technology",
-               "hrbp", "hris", "hrms", "human capital management", "human resources", "internal mobility",
-               "job analysis", "job design", "job evaluation", "kpis", "labor law", "learning and development",
-               "lms", "manager training", "onboarding", "organizational culture", "organizational development",
-               "payroll", "performance appraisal", "performance management", "personnel management",
-               "policy development", "recruiting", "recruitment", "remote onboarding", "retention strategy",
-               "reward management", "succession planning", "talent acquisition", "talent development",
-               "talent management", "termination process", "training", "training and development",
-               "workforce", "workforce analytics", "workforce planning"],
-        "Sales": ["account executive", "account management", "b2b sales", "b2c sales", "business development",
-                  "channel sales", "client engagement", "client relations", "cold calling", "commission",
-                  "consultative selling", "crm", "customer acquisition", "customer retention", "deal closing",
-                  "direct sales", "enterprise sales", "field sales", "inside sales", "key account management",
-                  "lead generation", "negotiation", "outside sales", "pipeline management", "product demo",
-                  "quota", "relationship building", "revenue", "sales", "sales analysis", "sales enablement",
-                  "sales forecasting", "sales funnel", "sales management", "sales operations", "sales planning",
-                  "sales process", "sales strategy", "salesforce", "solution selling", "territory management",
-                  "upselling", "value proposition"],
-        "Engineering": ["aerospace", "automation", "biomedical engineering", "cad", "circuit design", "civil",
-                        "chemical", "design", "electrical", "embedded systems", "engineer", "engineering analysis",
-                        "engineering design", "engineering drawing", "engineering management", "firmware",
-                        "hardware design", "hvac", "industrial engineering", "instrumentation", "maintenance engineering",
-                        "manufacturing", "materials science", "matlab", "mechanical", "mechatronics", "plant engineering",
-                        "process engineering", "product development", "product engineering", "project engineering",
-                        "quality engineering", "r&d", "research and development", "robotics", "simulation",
-                        "solidworks", "structural", "sustainable engineering", "systems"],
-        "Social Media": ["analytics dashboard", "audience engagement", "buffer", "community engagement",
-                         "community management", "content calendar", "content creation", "engagement",
-                         "facebook", "hashtag strategy", "hootsuite", "influencer", "instagram",
-                         "linkedin", "online community", "platform management", "reels", "schedule posts",
-                         "social listening", "social media", "social media analytics", "social media management",
-                         "social media marketing", "social media optimization", "social media platforms",
-                         "social media scheduling", "social media strategy", "tiktok", "trending content", "twitter",
-                         "user engagement", "youtube"],
-        "Operations": ["6 sigma", "business continuity", "business operations", "capacity planning", "continuous improvement",
-                       "distribution", "enterprise resource planning", "erp", "inventory control", "inventory management",
-                       "kaizen", "lean manufacturing", "logistics", "materials management", "operations", "operational efficiency",
-                       "operational excellence", "order fulfillment", "pmo", "process engineering", "process improvement",
-                       "production planning", "project management office", "procurement", "quality assurance",
-                       "quality control", "resource planning", "supply chain", "supply chain management", "vendor management",
-                       "warehouse management"],
-        "Healthcare": ["biotechnology", "clinical", "clinical research", "dentist", "doctor", "epidemiology", "health administration",
-                       "health information management", "health policy", "healthcare", "healthcare analytics", "hospital",
-                       "medical", "medical billing", "medical records", "mental health", "nurse", "occupational therapy",
-                       "patient care", "pharmacist", "pharmaceutical", "physical therapy", "physician", "public health",
-                       "radiology", "research", "telemedicine", "therapist"],
-        "Education": ["academic administration", "academic advising", "blended learning", "classroom management",
-                      "curriculum development", "distance education", "e-learning", "education", "educational leadership",
-                      "educational psychology", "educational technology", "higher education", "instructor", "k-12",
-                      "learning assessment", "lesson planning", "lms", "online teaching", "pedagogy", "professor",
-                      "remote instruction", "school administration", "special education", "student affairs",
-                      "student engagement", "syllabus design", "teacher", "teaching certification", "teaching methods",
-                      "training development", "tutoring"],
-        "Customer Service": ["call center", "client experience", "client success", "client support", "contact center", "crm tools",
-                             "customer care", "customer communication", "customer engagement", "customer experience",
-                             "customer feedback", "customer interaction", "customer relations", "customer satisfaction",
-                             "customer service", "customer support", "escalation handling", "help desk", "live chat support",
-                             "phone support", "problem resolution", "service desk", "support specialist", "technical support",
-                             "ticketing system", "troubleshooting", "user support"],
-        "Legal": ["affidavit", "attorney", "civil law", "compliance", "contract law", "corporate law", "court filings",
-                  "criminal law", "discovery", "dispute resolution", "esq", "ethics compliance", "family law", "intellectual property",
-                  "juris", "law", "law firm", "legal", "legal advisory", "legal assistant", "legal compliance",
-                  "legal counsel", "legal documentation", "legal research", "legal writing", "litigation", "paralegal",
-                  "real estate law", "regulatory affairs", "risk and compliance", "trial preparation"],
-        "Project Management": ["agile coach", "asana", "backlog grooming", "baseline management", "budget forecasting",
-                               "budget management", "change management", "confluence", "cost control", "gantt charts",
-                               "jira", "kanban", "milestone tracking", "portfolio management", "program management",
-                               "project lifecycle", "project management", "project planning", "pmp", "product lifecycle",
-                               "product owner", "progress tracking", "project coordination", "project delivery",
-                               "project execution", "resource allocation", "risk analysis", "risk management", "roadmap planning",
-                               "scrum", "scrum master", "stakeholder communication", "stakeholder management", "status reporting",
-                               "trello", "waterfall model", "work breakdown structure"]
-        }
-
-    # Check for category matches
-    for category, keywords_list in categories.items():
-        for keyword in keywords_list:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', text):
-                return category
+    category_scores = {}
+    for category in _CATEGORY_MATCHER.iter_matches(text):
+        category_scores[category] = category_scores.get(category, 0) + 1
+
+    return _top_category(category_scores, text), category_scores
+
+
+def _top_category(category_scores, text):
+    # The category with the most keyword hits; for lowercase text without any, "Other" or "Uncategorized"
+    if category_scores:
+        # max() keeps the first of equal scores, so ties go to the earlier category
+        return max(RESUME_CATEGORIES, key=lambda category: category_scores.get(category, 0))
 
     # If no specific category matches, try to infer from general terms
     if any(k in text for k in ["analyst", "consultant", "specialist", "manager", "coordinator"]):
@@ -261,3 +413,89 @@ def categorize_resume(text):
 
     return "Uncategorized"
 
+
+def categorize_resume(text):
+    return score_resume_categories(text)[0]
+
+
+def seniority_mask(text):
+    # Bit mask of the SENIORITY_KEYWORDS that occur in the (lowercase) text, as substrings
+    mask = 0
+    for bit, keyword in enumerate(SENIORITY_KEYWORDS):
+        if keyword in text:
+            mask |= 1 << bit
+    return mask
+
+
+def extract_experience_profile(raw_text, processed_text=None):
+    """Compact experience profile of a resume: (min_years, max_years, span_years, seniority_mask).
+
+    min_years/max_years come from the "X years experience" phrase with the highest upper
+    bound (None if there is none); span_years is the number of calendar years covered by
+    date spans, with overlapping spans counted once; seniority_mask is seniority_mask() of
+    the processed text. Computed once at upload so scoring is plain arithmetic.
+    """
+    if processed_text is None:
+        processed_text = raw_text.lower()
+
+    min_years = max_years = None
+    for match in EXPERIENCE_YEARS_RE.finditer(processed_text):
+        low = int(match.group(1))
+        high = int(match.group(2)) if match.group(2) else low
+        if max_years is None or high > max_years:
+            min_years, max_years = low, high
+
+    current_year = time.localtime().tm_year
+    spans = []
+    for match in DATE_SPAN_RE.finditer(raw_text):
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2).isdigit() else current_year
+        if start <= end <= current_year:
+            spans.append((start, end))
+    span_years = 0
+    covered_until = None
+    for start, end in sorted(spans):
+        if covered_until is not None and start < covered_until:
+            start = covered_until
+        if end > start:
+            span_years += end - start
+        covered_until = end if covered_until is None else max(covered_until, end)
+
+    return min_years, max_years, span_years, seniority_mask(processed_text)
+
+
+# Skills and category keywords in one trie, so a document is walked once for both
+_SKILL, _CATEGORY = 0, 1
+_ANALYSIS_MATCHER = _KeywordMatcher(
+    [(variant, (_SKILL, skill.replace('.', ''))) for skill in COMMON_SKILLS for variant in _skill_variants(skill)]
+    + [(keyword, (_CATEGORY, category)) for category, keywords_list in RESUME_CATEGORIES.items()
+       for keyword in keywords_list]
+)
+
+
+def analyze_document(text, tokenizer=None):
+    """Everything the app derives from a resume's raw text, in one normalisation pass.
+
+    The text is cleaned, lowercased and lemmatized once by preprocess_text(), and the
+    processed text is walked once for both skills and category keywords. Returns a dict of
+    processed_text, extracted_skills, categorized_field, category_scores and experience_profile
+    (see extract_experience_profile), with the same values the single-purpose functions give.
+    The dict holds only plain values, so it can cross process boundaries.
+    """
+    processed_text = preprocess_text(text, tokenizer)  # already lowercase
+
+    skills = set()
+    category_scores = {}
+    for kind, value in _ANALYSIS_MATCHER.iter_matches(processed_text):
+        if kind == _SKILL:
+            skills.add(value)
+        else:
+            category_scores[value] = category_scores.get(value, 0) + 1
+
+    return {
+        'processed_text': processed_text,
+        'extracted_skills': list(skills),
+        'categorized_field': _top_category(category_scores, processed_text),
+        'category_scores': category_scores,
+        'experience_profile': extract_experience_profile(text, processed_text)
+    }
@@ -0,0 +1,155 @@
+# vector_index.py
+import threading
+
+import numpy as np
+
+
+class VectorIndex:
+    """Approximate nearest-neighbour index (IVF) over unit-normalised embeddings, in NumPy.
+
+    Vectors are grouped into `sqrt(n)` clusters by spherical k-means; a search only scores
+    the vectors in the `nprobe` clusters whose centroids are closest to the query (and the
+    next closest ones while fewer than k vectors are gathered), instead of the whole pool. Below `train_threshold` vectors a search is simply exhaustive (and
+    exact). The clusters are retrained on search once the pool has grown `retrain_factor`
+    times since the last training; vectors added in between join their nearest cluster.
+
+    Similarity is the dot product, i.e. cosine similarity for unit-length vectors.
+    """
+
+    def __init__(self, nprobe=8, train_threshold=2048, retrain_factor=4, kmeans_iterations=10, seed=0):
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.retrain_factor = retrain_factor
+        self.kmeans_iterations = kmeans_iterations
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+        self._reset()
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+
+    def _reset(self):
+        self._vectors = None  # (capacity x dim) float32, first self._size rows in use
+        self._size = 0
+        self._ids = []
+        self._positions = {}  # id -> row
+        self._centroids = None
+        self._lists = []  # per cluster: list of rows
+        self._list_arrays = []  # per cluster: the same rows as an int array, built on search
+        self._trained_size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, item_id):
+        return item_id in self._positions
+
+    def ids(self):
+        with self._lock:
+            return list(self._ids)
+
+    def remove(self, ids):
+        # Drops the given ids (unknown ones are ignored). The remaining vectors are compacted
+        # and the clusters retrained on the next search; removals are rare (e.g. a cleared store)
+        with self._lock:
+            removed = {item_id for item_id in ids if item_id in self._positions}
+            if not removed:
+                return
+            keep = [row for row, item_id in enumerate(self._ids) if item_id not in removed]
+            vectors = self._vectors[keep]
+            kept_ids = [self._ids[row] for row in keep]
+            self._reset()
+            if kept_ids:
+                self._reserve(len(kept_ids), vectors.shape[1])
+                self._vectors[:len(kept_ids)] = vectors
+                self._ids = kept_ids
+                self._positions = {item_id: row for row, item_id in enumerate(kept_ids)}
+                self._size = len(kept_ids)
+
+    def add(self, ids, vectors):
+        # Ids already in the index are skipped; their vectors are assumed unchanged
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self._lock:
+            new_rows = [i for i, item_id in enumerate(ids) if item_id not in self._positions]
+            if not new_rows:
+                return
+            vectors = vectors[new_rows]
+            self._reserve(self._size + len(new_rows), vectors.shape[1])
+            start = self._size
+            self._vectors[start:start + len(new_rows)] = vectors
+            for offset, i in enumerate(new_rows):
+                self._positions[ids[i]] = start + offset
+                self._ids.append(ids[i])
+            self._size += len(new_rows)
+            if self._centroids is not None:
+                self._assign(np.arange(start, self._size), vectors)
+
+    def search(self, query, k=10, nprobe=None):
+        """Return up to k (id, similarity) pairs, most similar first."""
+        query = np.asarray(query, dtype=np.float32)
+        with self._lock:
+            if self._size == 0:
+                return []
+            if self._size >= self.train_threshold and self._size >= self._trained_size * self.retrain_factor:
+                self._train()
+            if self._centroids is None:
+                rows = np.arange(self._size)
+            else:
+                rows = self._probe(query, nprobe or self.nprobe, k)
+            similarities = self._vectors[rows] @ query
+            k = min(k, len(rows))
+            if k <= 0:
+                return []
+            top = np.argpartition(-similarities, k - 1)[:k]
+            top = top[np.argsort(-similarities[top], kind='stable')]
+            return [(self._ids[rows[i]], float(similarities[i])) for i in top]
+
+    def _reserve(self, size, dim):
+        # Grow the vector matrix geometrically so adds stay amortised O(1)
+        if self._vectors is None:
+            self._vectors = np.zeros((max(size, 1024), dim), dtype=np.float32)
+        elif size > len(self._vectors):
+            grown = np.zeros((max(size, 2 * len(self._vectors)), dim), dtype=np.float32)
+            grown[:self._size] = self._vectors[:self._size]
+            self._vectors = grown
+
+    def _probe(self, query, nprobe, k):
+        # Rows of the nprobe nearest clusters, plus further clusters in centroid order until
+        # at least k rows are gathered, so a search never comes back short of k
+        probed = []
+        gathered = 0
+        for cluster in np.argsort(-(self._centroids @ query)):
+            if len(probed) >= nprobe and gathered >= k:
+                break
+            if self._list_arrays[cluster] is None:
+                self._list_arrays[cluster] = np.array(self._lists[cluster], dtype=np.int64)
+            probed.append(self._list_arrays[cluster])
+            gathered += len(self._list_arrays[cluster])
+        return np.concatenate(probed)
+
+    def _assign(self, rows, vectors):
+        clusters = np.argmax(vectors @ self._centroids.T, axis=1)
+        for row, cluster in zip(rows, clusters):
+            self._lists[cluster].append(int(row))
+            self._list_arrays[cluster] = None
+
+    def _train(self):
+        # Spherical k-means on a sample, then every vector joins its nearest centroid
+        vectors = self._vectors[:self._size]
+        n_clusters = max(1, int(np.sqrt(self._size)))
+        sample_size = min(self._size, n_clusters * 64)
+        sample = vectors[self._rng.choice(self._size, sample_size, replace=False)]
+        centroids = sample[self._rng.choice(sample_size, n_clusters, replace=False)].copy()
+        for _ in range(self.kmeans_iterations):
+            clusters = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, clusters, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            # An empty cluster keeps its previous centroid
+            centroids = np.where(norms > 0, sums / np.maximum(norms, 1e-12), centroids)
+        self._centroids = centroids.astype(np.float32)
+        self._lists = [[] for _ in range(n_clusters)]
+        self._list_arrays = [None] * n_clusters
+        self._assign(np.arange(self._size), vectors)
+        self._trained_size = self._size
@@ -0,0 +1,122 @@
+# zip_stream.py
+import hashlib
+import os
+import tempfile
+import zipfile
+
+# Formats that are already compressed (DOCX is itself a ZIP); deflating them again costs
+# CPU for next to no saving, so they are STORED as they are
+STORED_EXTENSIONS = {'.pdf', '.docx', '.zip', '.png', '.jpg', '.jpeg', '.gz'}
+
+ZIP_CHUNK_SIZE = 64 * 1024
+
+
+class _ChunkBuffer:
+    # Write-only, unseekable file object that zipfile writes into; the generator drains it
+    # after every write, so at most about one chunk is ever held in memory
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def write(self, data):
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def pending(self):
+        # Bytes written but not drained yet
+        return len(self._buffer)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def iter_zip(entries, chunk_size=ZIP_CHUNK_SIZE):
+    """Yield a ZIP archive of `entries` ((path on disk, name in archive) pairs) piece by piece.
+
+    Files are read `chunk_size` bytes at a time and each piece is yielded as soon as it is
+    compressed, so neither the files nor the archive are ever held in memory as a whole.
+    """
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        for path, arcname in entries:
+            info = zipfile.ZipInfo.from_file(path, arcname)
+            if os.path.splitext(arcname)[1].lower() in STORED_EXTENSIONS:
+                info.compress_type = zipfile.ZIP_STORED
+            else:
+                info.compress_type = zipfile.ZIP_DEFLATED
+            with open(path, 'rb') as source, zf.open(info, 'w') as target:
+                while True:
+                    data = source.read(chunk_size)
+                    if not data:
+                        break
+                    target.write(data)
+                    if buffer.pending() >= chunk_size:
+                        yield buffer.drain()
+            if buffer.pending():
+                yield buffer.drain()
+    # Closing the archive writes the central directory
+    yield buffer.drain()
+
+
+class ArchiveCache:
+    """Finished archives on disk, keyed by what went into them.
+
+    The key covers every entry's name, path, size and modification time, so an unchanged
+    result set maps to the same archive and any change to it produces a new one. Only the
+    `max_files` most recently written archives are kept.
+    """
+
+    def __init__(self, directory, max_files=20):
+        self.directory = directory
+        self.max_files = max_files
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, entries):
+        digest = hashlib.sha256()
+        for path, arcname in entries:
+            stat = os.stat(path)
+            digest.update(f"{arcname}\0{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode('utf-8'))
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, f"{key}.zip")
+
+    def get(self, key):
+        path = self.path(key)
+        return path if os.path.exists(path) else None
+
+    def iter_and_store(self, key, chunks):
+        # Passes the chunks through while writing them to a temporary file, which becomes
+        # the cached archive only once the whole archive has been produced
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.part')
+        completed = False
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    yield chunk
+            os.replace(temp_path, self.path(key))
+            completed = True
+            self._evict()
+        finally:
+            if not completed and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _evict(self):
+        archives = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                    if name.endswith('.zip')]
+        archives.sort(key=os.path.getmtime)
+        for path in archives[:-self.max_files]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass